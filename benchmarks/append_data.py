@@ -0,0 +1,49 @@
+'''
+compare bytes sent to a rendered chart when points stream in, by `update_option` and by `append_data`:
+
+    python benchmarks/append_data.py [chunks] [points per chunk]
+'''
+import sys
+from time import perf_counter
+import numpy as np
+from raw_echarts.charts import *
+
+
+class Recorder:
+    '''
+    stands for the notebook, counts js sent to the browser
+    '''
+
+    def __init__(self):
+        self.bytes = 0
+
+    def run_js(self, js):
+        self.bytes += len(js)
+
+
+def stream(chunks, size, append):
+    c = Chart()
+    c.notebook = Recorder()
+    c.xAxis(type='value')
+    c.yAxis.use()
+    c.add_chart(Scatter('telemetry', []))
+    c.update_option()
+    t = perf_counter()
+    for i in range(chunks):
+        chunk = np.random.rand(size, 2).tolist()
+        if append:
+            c.append_data(0, chunk)
+        else:
+            c.series[0].append_data(chunk)
+            c.update_option()
+    c.flush_data()
+    return perf_counter()-t, c.notebook.bytes
+
+
+if __name__ == '__main__':
+    chunks = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    print('{:<14} {:>10} {:>14}'.format('update by', 'ms', 'bytes sent'))
+    for name, append in [('update_option', False), ('append_data', True)]:
+        t, sent = stream(chunks, size, append)
+        print('{:<14} {:>10.1f} {:>14}'.format(name, t*1000, sent))
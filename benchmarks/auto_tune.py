@@ -0,0 +1,27 @@
+'''
+time of filling in large/progressive/animation options when series are added to charts:
+
+    python benchmarks/auto_tune.py [series]
+'''
+import sys
+from time import perf_counter
+import numpy as np
+from raw_echarts.charts import *
+
+
+def scatter_chart(points, count):
+    c = Chart()
+    for i in range(count):
+        c.add_chart(Scatter(f's{i}', points))
+    return c
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    points = np.random.rand(1000000, 2)
+    print('{:<10} {:>10}'.format('auto tune', 'ms'))
+    for auto in [False, True]:
+        CONFIG.AUTO_TUNE = auto
+        t = perf_counter()
+        c = scatter_chart(points, count)
+        print('{:<10} {:>10.1f}'.format(str(auto), (perf_counter()-t)*1000))
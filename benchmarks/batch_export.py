@@ -0,0 +1,26 @@
+'''
+compare serial, thread pool and process pool export of chart pages:
+
+    python benchmarks/batch_export.py [charts] [points]
+'''
+import os
+import sys
+import tempfile
+import functools
+from time import perf_counter
+from json_backends import line_chart
+from raw_echarts.export import export_files
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    folder = tempfile.mkdtemp()
+    make = functools.partial(line_chart, n)
+    print('{:<10} {:>10} {:>8}'.format('mode', 'ms', 'errors'))
+    for name, kw in [('serial', {'workers': 0}), ('threads', {'threads': True}), ('processes', {})]:
+        jobs = ((make, os.path.join(folder, f'{name}{i}')) for i in range(count))
+        t = perf_counter()
+        errors = sum(1 for path, error in export_files(jobs, **kw) if error is not None)
+        t = perf_counter()-t
+        print('{:<10} {:>10.1f} {:>8}'.format(name, t*1000, errors))
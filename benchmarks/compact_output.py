@@ -0,0 +1,32 @@
+'''
+compare size and time of pretty and compact html output:
+
+    python benchmarks/compact_output.py [repeat]
+'''
+import sys
+from time import perf_counter
+from json_backends import CHARTS
+from raw_echarts.bases import CONFIG
+
+
+def bench(chart, compact, repeat):
+    best = None
+    for i in range(repeat):
+        t = perf_counter()
+        text = chart.render_file(compact=compact)
+        t = perf_counter()-t
+        best = t if best is None else min(best, t)
+    return best, len(text.encode('utf-8'))
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    CONFIG.CACHE_JSON = False  # encode the whole chart every time
+    print('{:<10} {:<8} {:>10} {:>12} {:>7}'.format('chart', 'mode', 'ms', 'bytes', 'size'))
+    for name, make in CHARTS.items():
+        chart = make()
+        pretty_time, pretty_size = bench(chart, False, repeat)
+        compact_time, compact_size = bench(chart, True, repeat)
+        print('{:<10} {:<8} {:>10.1f} {:>12} {:>7}'.format(name, 'pretty', pretty_time*1000, pretty_size, '100%'))
+        print('{:<10} {:<8} {:>10.1f} {:>12} {:>6.0f}%'.format(
+            name, 'compact', compact_time*1000, compact_size, compact_size*100/pretty_size))
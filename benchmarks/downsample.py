@@ -0,0 +1,46 @@
+'''
+compare writing the full series data with downsampling it in python first:
+
+    python benchmarks/downsample.py [points] [threshold]
+'''
+import sys
+from time import perf_counter
+import numpy as np
+from raw_echarts.charts import *
+from raw_echarts import sampling
+
+
+def line_chart(y, threshold=None, method='lttb'):
+    c = Chart()
+    c.xAxis(type='value')
+    c.yAxis.use()
+    line = Line('y', y)
+    if threshold is not None:
+        line.downsample(threshold, method)
+    c.add_chart(line)
+    return c
+
+
+def bench(make):
+    t = perf_counter()
+    size = len(make().to_json(compact=True))
+    return perf_counter()-t, size
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    threshold = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    CONFIG.CACHE_JSON = False
+    y = np.cumsum(np.random.randn(n))
+    cases = [('full', 'ndarray', lambda: line_chart(y)),
+             ('lttb', 'ndarray', lambda: line_chart(y, threshold)),
+             ('minmax', 'ndarray', lambda: line_chart(y, threshold, 'minmax')),
+             ('lttb', 'list', lambda: line_chart(y.tolist(), threshold))]
+    print('{:<8} {:<8} {:>10} {:>12}'.format('data', 'input', 'ms', 'bytes'))
+    for name, kind, make in cases:
+        t, size = bench(make)
+        print('{:<8} {:<8} {:>10.1f} {:>12}'.format(name, kind, t*1000, size))
+
+    sampling.np = None  # the pure python fallback
+    t, size = bench(lambda: line_chart(y.tolist(), threshold))
+    print('{:<8} {:<8} {:>10.1f} {:>12}'.format('lttb', 'python', t*1000, size))
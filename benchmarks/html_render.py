@@ -0,0 +1,75 @@
+'''
+compare the template html renderer with the former lxml one:
+
+    python benchmarks/html_render.py [repeat]
+'''
+import sys
+from time import perf_counter
+from json_backends import CHARTS
+from raw_echarts.bases import CONFIG
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+
+def lxml_render_file(chart, title='Awesome Echarts'):
+    '''
+    `Chart.render_file` as it was done with lxml
+    '''
+    root = etree.Element('div', {'id': f'{chart.chart_id}_container'})
+    div = etree.Element('div', {'id': chart.chart_id, 'class': 'chart-container',
+                                'style': f'width:{chart.width};height:{chart.height};'})
+    script = etree.Element('script')
+    script.text = f'''
+        var chart_{chart.chart_id}=echarts.init(document.getElementById("{chart.chart_id}"),"white",{{"renderer":"canvas"}});
+        var option_{chart.chart_id}={chart.to_json(compact=False)};
+        chart_{chart.chart_id}.setOption(option_{chart.chart_id});
+        '''
+    div.append(script)
+    root.append(div)
+    embed = etree.tostring(root, method='HTML', pretty_print=True).decode()
+
+    root = etree.HTML('<html/>')
+    head = etree.Element('head')
+    head.append(etree.Element('meta', charset='UTF-8'))
+    head.append(etree.Element('meta', name='viewport', content='width=device-width, initial-scale=1'))
+    head.append(etree.Element('meta', name='theme-color', content='#000000'))
+    head.append(etree.Element('meta', name='description', content='Awesome ECharts'))
+    t = etree.Element('title')
+    t.text = title
+    head.append(t)
+    for js in [CONFIG.ECHARTS_ASSETS+'/echarts.min.js']+chart._js_dependences:
+        head.append(etree.Element('script', {'type': 'text/javascript', 'src': js}))
+    body = etree.Element('body')
+    noscript = etree.Element('noscript')
+    noscript.text = 'you should enable javascript to run this app.'
+    body.append(noscript)
+    body.append(etree.fromstring(embed, etree.XMLParser(huge_tree=True)))
+    root.append(head)
+    root.append(body)
+    return '<!DOCTYPE html>\n'+etree.tostring(root, method='HTML', pretty_print=True).decode()
+
+
+def bench(render, repeat):
+    best = None
+    for i in range(repeat):
+        t = perf_counter()
+        text = render()
+        t = perf_counter()-t
+        best = t if best is None else min(best, t)
+    return best, text
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    CONFIG.CACHE_JSON = False  # encode the whole chart every time
+    print('{:<10} {:<10} {:>10} {:>6}'.format('chart', 'renderer', 'ms', 'same'))
+    for name, make in CHARTS.items():
+        chart = make()
+        t, text = bench(lambda: chart.render_file(compact=False), repeat)
+        print('{:<10} {:<10} {:>10.1f} {:>6}'.format(name, 'template', t*1000, ''))
+        if etree is not None:
+            t, lxml_text = bench(lambda: lxml_render_file(chart), repeat)
+            print('{:<10} {:<10} {:>10.1f} {:>6}'.format(name, 'lxml', t*1000, str(lxml_text == text)))
@@ -0,0 +1,67 @@
+'''
+compare json backends on chart payloads:
+
+    python benchmarks/json_backends.py [repeat]
+'''
+import sys
+from raw_echarts.charts import *
+from raw_echarts.bases import JSON_BACKENDS
+from time import perf_counter
+
+
+def line_chart(n=200000):
+    c = Chart()
+    c.title(text='line')
+    c.xAxis(data=list(range(n)))
+    c.add_chart(Line('a', [i*0.5 for i in range(n)]))
+    c.add_chart(Line('b', [i % 97 for i in range(n)]))
+    return c
+
+
+def scatter_chart(n=100000):
+    c = Chart()
+    c.title(text='scatter')
+    c.add_chart(Scatter('points', [[i, (i*7) % 1000/10] for i in range(n)]))
+    return c
+
+
+def formatter_chart(n=2000):
+    c = Chart()
+    c.title(text='formatters')
+    bar = Bar('bar', [{'name': str(i), 'value': i, 'label': {'show': True, 'formatter': JsCode('function(p){return p.value+"%";}')}}
+                      for i in range(n)])
+    bar.itemStyle(color=LinearGradient(colors=['red', 'blue']))
+    c.add_chart(bar)
+    return c
+
+
+CHARTS = {
+    'line': line_chart,
+    'scatter': scatter_chart,
+    'formatter': formatter_chart,
+}
+
+
+def bench(chart, backend, indent, repeat):
+    CONFIG.JSON_BACKEND = backend
+    best = None
+    for i in range(repeat):
+        t = perf_counter()
+        text = chart.to_json(indent=indent)
+        t = perf_counter()-t
+        best = t if best is None else min(best, t)
+    return best, len(text.encode('utf-8'))
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    CONFIG.CACHE_JSON = False  # encode the whole chart every time
+    backends = [None]+list(JSON_BACKENDS)
+    print('{:<10} {:<12} {:<7} {:>10} {:>12}'.format('chart', 'backend', 'indent', 'ms', 'bytes'))
+    for name, make in CHARTS.items():
+        chart = make()
+        for backend in backends:
+            for indent in [4, None]:
+                t, size = bench(chart, backend, indent, repeat)
+                print('{:<10} {:<12} {:<7} {:>10.1f} {:>12}'.format(name, backend or 'stream', str(indent), t*1000, size))
+    CONFIG.JSON_BACKEND = None
@@ -0,0 +1,43 @@
+'''
+compare series data given as numpy arrays and as lists, from building the chart to json:
+
+    python benchmarks/numpy_data.py [points]
+'''
+import sys
+import tracemalloc
+from time import perf_counter
+import numpy as np
+from raw_echarts.charts import *
+
+
+def line_chart(x, y):
+    c = Chart()
+    c.xAxis(type='value')
+    c.yAxis.use()
+    c.add_chart(Line('y', y))
+    c.add_chart(Scatter('points', x))
+    return c
+
+
+def bench(make):
+    t = perf_counter()
+    size = len(make().to_json(compact=True))
+    t = perf_counter()-t
+    # traced separately, tracing slows down allocations a lot
+    tracemalloc.start()
+    make().to_json(compact=True)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return t, peak, size
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    CONFIG.CACHE_JSON = False
+    y = np.random.rand(n)
+    points = np.random.rand(n//2, 2)
+    print('{:<8} {:>10} {:>10} {:>12}'.format('data', 'ms', 'peak MB', 'bytes'))
+    for name, make in [('ndarray', lambda: line_chart(points, y)),
+                       ('list', lambda: line_chart(points.tolist(), y.tolist()))]:
+        t, peak, size = bench(make)
+        print('{:<8} {:>10.1f} {:>10.1f} {:>12}'.format(name, t*1000, peak/1e6, size))
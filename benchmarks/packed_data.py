@@ -0,0 +1,36 @@
+'''
+compare writing large numeric series as decimal json and as base64 typed arrays:
+
+    python benchmarks/packed_data.py [points]
+'''
+import sys
+from time import perf_counter
+import numpy as np
+from raw_echarts.charts import *
+
+
+def scatter_chart(points, dtype=None):
+    c = Chart()
+    c.xAxis(type='value')
+    c.yAxis.use()
+    c.add_chart(Scatter('points', points))
+    if dtype is not None:
+        c.pack_data(dtype)
+    return c
+
+
+def bench(make):
+    t = perf_counter()
+    size = len(make().render_file(compact=True))
+    return perf_counter()-t, size
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    CONFIG.CACHE_JSON = False
+    points = np.random.rand(n, 2)*1000
+    print('{:<8} {:<8} {:>10} {:>12}'.format('data', 'dtype', 'ms', 'bytes'))
+    for kind, data in [('ndarray', points), ('list', points.tolist())]:
+        for dtype in [None, 'f8', 'f4']:
+            t, size = bench(lambda: scatter_chart(data, dtype))
+            print('{:<8} {:<8} {:>10.1f} {:>12}'.format(kind, dtype or 'json', t*1000, size))
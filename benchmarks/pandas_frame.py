@@ -0,0 +1,38 @@
+'''
+compare building a line chart from a DataFrame with per-row loops and with `Chart.from_dataframe`:
+
+    python benchmarks/pandas_frame.py [rows]
+'''
+import sys
+from time import perf_counter
+import numpy as np
+import pandas as pd
+from raw_echarts.charts import *
+
+
+def loop_chart(df):
+    c = Chart()
+    c.xAxis(type='category', data=[t.isoformat() for t in df['t']])
+    c.yAxis.use()
+    for col in ['a', 'b']:
+        c.add_chart(Line(col, [v for v in df[col]]))
+    return c
+
+
+def frame_chart(df):
+    return Chart.from_dataframe(df, x='t')
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    CONFIG.CACHE_JSON = False
+    df = pd.DataFrame({'t': pd.date_range('2020-01-01', periods=n, freq='s'),
+                       'a': np.random.rand(n), 'b': np.arange(n)})
+    print('{:<8} {:>10} {:>10}'.format('build', 'chart ms', 'json ms'))
+    for name, make in [('loop', loop_chart), ('frame', frame_chart)]:
+        t = perf_counter()
+        c = make(df)
+        build = perf_counter()-t
+        t = perf_counter()
+        c.to_json(compact=True)
+        print('{:<8} {:>10.1f} {:>10.1f}'.format(name, build*1000, (perf_counter()-t)*1000))
@@ -0,0 +1,38 @@
+'''
+compare json of float64 series data written at full precision and rounded:
+
+    python benchmarks/precision.py [points]
+'''
+import sys
+from time import perf_counter
+import numpy as np
+from raw_echarts.charts import *
+
+
+def line_chart(y, points, digits=None, decimals=None):
+    c = Chart()
+    c.xAxis(type='value')
+    c.yAxis.use()
+    c.add_chart(Line('y', y))
+    c.add_chart(Scatter('points', points))
+    c.set_precision(digits, decimals)
+    return c
+
+
+def bench(make):
+    c = make()
+    t = perf_counter()
+    size = len(c.to_json(compact=True))
+    return perf_counter()-t, size
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    CONFIG.CACHE_JSON = False
+    y = np.random.rand(n)*100
+    points = np.random.rand(n//2, 2)*100
+    print('{:<8} {:<10} {:>10} {:>12}'.format('data', 'precision', 'ms', 'bytes'))
+    for kind, ys, ps in [('ndarray', y, points), ('list', y.tolist(), points.tolist())]:
+        for name, kw in [('full', {}), ('6 digits', {'digits': 6}), ('2 dec', {'decimals': 2})]:
+            t, size = bench(lambda: line_chart(ys, ps, **kw))
+            print('{:<8} {:<10} {:>10.1f} {:>12}'.format(kind, name, t*1000, size))
@@ -0,0 +1,36 @@
+'''
+compare peak memory of rendering html to a string and streaming it to a gzip file:
+
+    python benchmarks/stream_render.py [points]
+'''
+import sys
+import gzip
+import tracemalloc
+from time import perf_counter
+from json_backends import line_chart
+from raw_echarts.bases import CONFIG
+
+
+def bench(render):
+    tracemalloc.start()
+    t = perf_counter()
+    render()
+    t = perf_counter()-t
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return t, peak
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    CONFIG.CACHE_JSON = False  # encode the whole chart every time
+    chart = line_chart(n)
+
+    def stream():
+        with gzip.open('stream_render.html.gz', 'wb') as fp:
+            chart.render_file(fp)
+
+    print('{:<10} {:>10} {:>10}'.format('render', 'ms', 'peak MB'))
+    for name, render in [('string', chart.render_file), ('stream', stream)]:
+        t, peak = bench(render)
+        print('{:<10} {:>10.1f} {:>10.1f}'.format(name, t*1000, peak/1e6))
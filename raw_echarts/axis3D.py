@@ -123,6 +123,8 @@ class ViewControl(Option):
 
 
 class ShadingMixin:
+    __slots__ = ()
+
     environment = RawOption()
     shading = RawOption(value_choices=['color', 'lambert', 'realistic'])
     realisticMaterial = RealisticMaterial()
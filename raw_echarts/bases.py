@@ -1,30 +1,55 @@
-from collections import OrderedDict
+import abc
 from copy import deepcopy
+import re
 import uuid
+import weakref
 import os
 import simplejson as json
+import json as std_json
 import base64
+from array import array
 from datetime import date, time, datetime
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 def CustomAttributeError(obj, attr):
     return AttributeError('{} has no attribute: "{}"'.format(obj, attr))
 
 
-class CustomJsonEncoder(json.JSONEncoder):
+def ndarray_list(a):
+    '''
+    `a.tolist()` with NaN of float arrays as None, they are missing values
+    '''
+    if a.dtype.kind == 'f' and a.ndim:
+        missing = np.isnan(a)
+        if missing.any():
+            a = a.astype(object)
+            a[missing] = None
+    return a.tolist()
+
+
+class JsonEncoderMixin:
     '''
     encode date/time/datetime to isoformat, JsCode without quotes.
     '''
 
     def __init__(self, *args, **kw):
         super().__init__(*args, **kw)
-        self._to_replace = {}
+        # JsCode is encoded as "<prefix><index>" first, all of them are replaced in one pass at last.
+        self._prefix = 'jscode-{}-'.format(uuid.uuid4().hex)
+        self._js_codes = []
 
     def default(self, o):
         if isinstance(o, JsCode):
-            key = uuid.uuid4().hex
-            self._to_replace[key] = o.js
-            return key
+            self._js_codes.append(o.js)
+            return '{}{}'.format(self._prefix, len(self._js_codes)-1)
         elif isinstance(o, Image):
             return o.url or o.uri
         elif isinstance(o, (date, time, datetime)):
@@ -32,7 +57,13 @@ class CustomJsonEncoder(json.JSONEncoder):
         elif isinstance(o, Empty):
             return super().default(None)
         elif isinstance(o, ODD):
-            return o._data
+            return o.as_dict()
+        elif isinstance(o, (array, memoryview)):
+            return o.tolist()
+        elif np is not None and isinstance(o, (np.ndarray, np.generic)):
+            return ndarray_list(o)
+        elif isinstance(o, LazyValue):
+            return o.value()
         elif isinstance(o, RawOption):
             return o._data
         elif isinstance(o, Option):
@@ -43,17 +74,108 @@ class CustomJsonEncoder(json.JSONEncoder):
         return super().default(o)
 
     def encode(self, obj):
+        self._js_codes = []
         content = super().encode(obj)
-        for k, v in self._to_replace.items():
-            content = content.replace('"{}"'.format(k), v)
-        return content
+        return _put_js_codes(content, self._prefix, self._js_codes)
+
+
+def _put_js_codes(content, prefix, codes):
+    '''
+    replace "<prefix><index>" placeholders with js codes in one pass
+    '''
+    if codes:
+        content = re.sub('"{}(\\d+)"'.format(prefix), lambda m: codes[int(m.group(1))], content)
+    return content
+
+
+class CustomJsonEncoder(JsonEncoderMixin, json.JSONEncoder):
+    pass
+
+
+class StdJsonEncoder(JsonEncoderMixin, std_json.JSONEncoder):
+    pass
+
+
+# name -> function(obj, indent, sort_keys, ensure_ascii, separators) returns json text
+JSON_BACKENDS = {}
+
+
+def register_json_backend(name, func):
+    JSON_BACKENDS[name] = func
+
+
+def get_json_backend(name=None):
+    '''
+    json backend of `name`, or `CONFIG.JSON_BACKEND`, or simplejson
+    '''
+    name = name or CONFIG.JSON_BACKEND or 'simplejson'
+    if name not in JSON_BACKENDS:
+        raise ValueError('json backend "{}" is not available, choices: {}'.format(name, list(JSON_BACKENDS)))
+    return JSON_BACKENDS[name]
+
+
+def _dumps_simplejson(obj, indent=4, sort_keys=False, ensure_ascii=True, separators=None):
+    return json.dumps(obj, ensure_ascii=ensure_ascii, cls=CustomJsonEncoder, indent=indent, sort_keys=sort_keys,
+                      separators=separators)
+
+
+def _dumps_std_json(obj, indent=4, sort_keys=False, ensure_ascii=True, separators=None):
+    return std_json.dumps(obj, ensure_ascii=ensure_ascii, cls=StdJsonEncoder, indent=indent, sort_keys=sort_keys,
+                          separators=separators, allow_nan=False)
+
+
+def _dumps_orjson(obj, indent=4, sort_keys=False, ensure_ascii=True, separators=None):
+    '''
+    orjson only indents with 2 spaces and always writes utf-8 without spaces, `ensure_ascii` and `separators` are ignored.
+    dates are written by orjson natively, nodes should be converted by `to_plain` first.
+    NaN and inf are written as null, the other backends raise ValueError.
+    '''
+    prefix = 'jscode-{}-'.format(uuid.uuid4().hex)
+    codes = []
+
+    def default(o):
+        if isinstance(o, JsCode):
+            codes.append(o.js)
+            return '{}{}'.format(prefix, len(codes)-1)
+        elif isinstance(o, Image):
+            return o.url or o.uri
+        elif isinstance(o, Empty):
+            return None
+        elif isinstance(o, (ODD, OptionBase)):
+            return to_plain(o)
+        elif isinstance(o, (array, memoryview)):
+            return o.tolist()
+        elif np is not None and isinstance(o, (np.ndarray, np.generic)):  # dtypes orjson doesn't take
+            return ndarray_list(o)
+        elif isinstance(o, LazyValue):
+            return o.value()
+        raise TypeError('Object of type {} is not JSON serializable'.format(o.__class__.__name__))
+
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    content = orjson.dumps(obj, default=default, option=option).decode('utf-8')
+    return _put_js_codes(content, prefix, codes)
+
+
+register_json_backend('simplejson', _dumps_simplejson)
+register_json_backend('json', _dumps_std_json)
+if orjson is not None:
+    register_json_backend('orjson', _dumps_orjson)
 
 
-def dumps(obj, indent=4, sort_keys=False, ensure_ascii=True):
+# separators of compact output
+COMPACT_SEPARATORS = (',', ':')
+
+
+def dumps(obj, indent=4, sort_keys=False, ensure_ascii=True, separators=None, backend=None):
     '''
-    dump an option object to json
+    dump an option object to json, by `backend` or `CONFIG.JSON_BACKEND`
     '''
-    return json.dumps(obj, ensure_ascii=ensure_ascii, cls=CustomJsonEncoder, indent=indent, sort_keys=sort_keys)
+    return get_json_backend(backend)(obj, indent=indent, sort_keys=sort_keys, ensure_ascii=ensure_ascii,
+                                     separators=separators)
 
 
 class _Config:
@@ -61,6 +183,14 @@ class _Config:
     some global config including:
             echarts js assets url
             type of notebook, notebook or lab
+            strict params: only accept exact param names, no fuzzy matching of params and values
+            json backend: simplejson, json or orjson, None to use the streaming writer for charts
+            compact output: json without indent and spaces, html without pretty print
+            cache json: keep json fragments of unchanged options between `to_json` calls, off by default.
+                raw values changed in place but not through options (e.g. a list passed as series data
+                and appended later, numpy arrays written into) are not seen, turn it on only if that's not done.
+            auto tune: fill in large/progressive/animation options of series added to charts by data volume,
+                `Chart.auto_tune` updates them.
     '''
     __ins = None
     __inited = False
@@ -77,6 +207,11 @@ class _Config:
             self.ECHARTS_ASSETS = 'http://127.0.0.1/assets/'
             # todo: support help text in different languages.
             self.LOCALE = 'CN'
+            self.STRICT_PARAMS = False
+            self.JSON_BACKEND = None
+            self.COMPACT_OUTPUT = False
+            self.CACHE_JSON = False
+            self.AUTO_TUNE = True
             self.__class__.__inited = True
 
     def add_callback(self, callback=None):
@@ -179,6 +314,27 @@ class JsCode:
         self.js = js
         self.js_code = '{p}{js}{p}'.format(p='--x_x--0_0--', js=js)
 
+    def __eq__(self, other):
+        # the same code built again is the same value, e.g. by `get_option` for option diffs
+        if isinstance(other, JsCode):
+            return self.js == other.js
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.js)
+
+
+class LazyValue(abc.ABC):
+    '''
+    raw value computed when the option is written to json or converted by `to_plain`, e.g. sampled series data.
+    '''
+
+    @abc.abstractmethod
+    def value(self):
+        '''
+        the value written in place of this one
+        '''
+
 
 def LinearGradient(x0=0, y0=0, x1=0, y1=1, colors=[], globalCoord=False):
     '''
@@ -245,18 +401,27 @@ class Image:
 
 class ODD:
     '''
-    wrapper of OrderedDict, features:
+    ordered dict with positional access, features:
+        - odd[int] gets item by position, odd[key] by key
+        - add items before/after a position, key or value
+        - positions of keys and identities of option values are indexed
     '''
+    __slots__ = ('_data', '_keys', '_pos', '_vindex', '_dirty', '_inited')
 
     def __init__(self, *args, **kw):
-        self._data = OrderedDict(*args, **kw)
+        self._data = dict(*args, **kw)
+        self._keys = list(self._data)
+        self._pos = None  # key -> position, built on demand
+        self._vindex = None  # id(option value) -> key, built on demand
+        self._dirty = False  # order of `_data` differs from `_keys`
         self._inited = True
 
     def __getattr__(self, attr):
-        if attr.startswith('__'):
-            raise CustomAttributeError(self, attr)
+        if attr.startswith('_'):
+            # bookkeeping not set yet, e.g. while copying, don't repr self here
+            raise AttributeError(attr)
 
-        if attr in self._data.keys():
+        if attr in self._data:
             return self._data[attr]
 
         raise CustomAttributeError(self, attr)
@@ -269,24 +434,77 @@ class ODD:
     def __setitem__(self, key, val):
         if isinstance(key, int):
             key = self.key(key)
-        self._data[key] = val
+        self._set(key, val)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._keys)
 
     def __repr__(self):
-        if '_inited' in self.__dict__:
-            return dict(self._data).__repr__()
+        if getattr(self, '_inited', False):
+            return dict(self.items()).__repr__()
         return super().__repr__()
 
     def __len__(self):
-        return len(self._data)
+        return len(self._keys)
+
+    def _set(self, key, val):
+        data = self._data
+        if key in data:
+            old = data[key]
+            if self._vindex is not None and isinstance(old, OptionBase):
+                self._vindex.pop(id(old), None)
+        else:
+            if self._pos is not None:
+                self._pos[key] = len(self._keys)
+            self._keys.append(key)
+        data[key] = val
+        if self._vindex is not None and isinstance(val, OptionBase):
+            self._vindex[id(val)] = key
+
+    def _positions(self):
+        if self._pos is None:
+            self._pos = dict((k, i) for i, k in enumerate(self._keys))
+        return self._pos
+
+    def _values_index(self):
+        if self._vindex is None:
+            self._vindex = dict((id(v), k) for k, v in self._data.items() if isinstance(v, OptionBase))
+        return self._vindex
+
+    def __getstate__(self):
+        # indexes of positions and option ids are built again on demand
+        return self.as_dict()
+
+    def __setstate__(self, state):
+        self._data = state
+        self._keys = list(state)
+        self._pos = None
+        self._vindex = None
+        self._dirty = False
+        self._inited = True
+
+    def as_dict(self):
+        '''
+        the underlying dict in order, don't change it.
+        '''
+        if self._dirty:
+            data = self._data
+            self._data = dict((k, data[k]) for k in self._keys)
+            self._dirty = False
+        return self._data
 
     def get(self, key):
         return self._data.get(key)
 
     def update(self, d, **kw):
-        return self._data.update(d, **kw)
+        for k, v in dict(d, **kw).items():
+            self._set(k, v)
 
     def index(self, key_or_val, positive=False):
-        dl = len(self._data)
+        dl = len(self._keys)
 
         if isinstance(key_or_val, int):
             if key_or_val < 0 and positive:
@@ -294,11 +512,19 @@ class ODD:
             if -dl <= key_or_val < dl:
                 return key_or_val
 
-        if key_or_val in self._data.values():
-            return list(self._data.values()).index(key_or_val)
+        try:
+            if key_or_val in self._data:
+                return self._positions()[key_or_val]
+        except TypeError:  # unhashable value
+            pass
+
+        key = self._values_index().get(id(key_or_val))
+        if key is not None:
+            return self._positions()[key]
 
-        if key_or_val in self._data.keys():
-            return list(self._data.keys()).index(key_or_val)
+        for i, k in enumerate(self._keys):
+            if self._data[k] == key_or_val:
+                return i
 
     def key(self, index=None, value=None):
         if index is not None:
@@ -307,7 +533,7 @@ class ODD:
             index = self.index(value)
 
         if index is not None:
-            return list(self._data.keys())[index]
+            return self._keys[index]
 
         return index
 
@@ -315,12 +541,12 @@ class ODD:
         if key is None:
             key = uuid.uuid4().hex
 
-        dl = len(self._data)
+        dl = len(self._keys)
         index = dl
 
         if after is not None:
             t = self.index(after, True)
-            if isinstance(index, int):
+            if isinstance(t, int):
                 index = t+1
 
         if before is not None:
@@ -328,14 +554,17 @@ class ODD:
             if isinstance(t, int):
                 index = t
 
-        if index == -1 or index >= dl:  # append
-            self._data[key] = val
-        elif index == 0 or index <= -dl:  # prepend
-            self._data[key] = val
-            self._data.move_to_end(key, False)
+        if index == -1 or index >= dl or key in self._data:  # append, existed key keeps its position
+            self._set(key, val)
         else:
-            items = list(self._data.items())
-            self._data = OrderedDict(items[:index]+[(key, val)]+items[index:])
+            if index <= -dl:  # prepend
+                index = 0
+            self._keys.insert(index, key)
+            self._data[key] = val
+            self._pos = None
+            if self._vindex is not None and isinstance(val, OptionBase):
+                self._vindex[id(val)] = key
+            self._dirty = True
         return self
 
     def append(self, val):
@@ -343,21 +572,96 @@ class ODD:
 
     def pop(self, key=-1):
         key = self.key(key)
-        return self._data.pop(key)
+        val = self._data.pop(key)
+        if self._keys[-1] == key:
+            self._keys.pop()
+            if self._pos is not None:
+                self._pos.pop(key, None)
+        else:
+            del self._keys[self._positions()[key]]
+            self._pos = None
+        if self._vindex is not None and isinstance(val, OptionBase):
+            self._vindex.pop(id(val), None)
+        return val
 
     def clone(self):
-        return type(self)(deepcopy(self._data).items())
+        return type(self)(deepcopy(list(self.items())))
 
     def items(self):
-        return self._data.items()
+        return self.as_dict().items()
 
     @property
     def key_list(self):
-        return list(self._data.keys())
+        return list(self._keys)
 
     @property
     def value_list(self):
-        return list(self._data.values())
+        data = self._data
+        return [data[k] for k in self._keys]
+
+
+def _is_immutable(value):
+    return value is None or isinstance(value, (str, int, float, bool, bytes, JsCode))
+
+
+_SCALAR_TYPES = frozenset([str, int, float, bool, bytes, type(None)])
+
+
+def _copy_value(value):
+    '''
+    deepcopy, flat lists of scalars (most series data) are copied shallowly.
+    '''
+    if type(value) is list and all(type(x) in _SCALAR_TYPES for x in value):
+        return value[:]
+    return deepcopy(value)
+
+
+def to_plain(v):
+    '''
+    convert option nodes to plain dict/list, JsCode/Image/dates are kept as is.
+    `array`s and memoryviews (e.g. compact dataset columns) become lists, numpy arrays are copied.
+    '''
+    if isinstance(v, RawOption):
+        return to_plain(v._data)
+    if isinstance(v, Option):
+        if v._as_array and isinstance(v._data, ODD):
+            return [to_plain(x) for x in v._data.value_list]
+        else:
+            return to_plain(v._data)
+    if isinstance(v, list):
+        if set(map(type, v)) <= _SCALAR_TYPES:
+            return v[:]
+        return [to_plain(x) for x in v]
+    if isinstance(v, (array, memoryview)):
+        return v.tolist()
+    if isinstance(v, LazyValue):
+        return to_plain(v.value())
+    if np is not None and isinstance(v, np.ndarray):
+        return v.copy()
+    if isinstance(v, (dict, ODD)):
+        return dict([(v._get_data_key() if isinstance(v, OptionBase) else to_plain(k), to_plain(v)) for k, v in v.items()])
+    return v
+
+
+def _clone_data(data, old_parent, new_parent):
+    '''
+    copy `_data` of an option, children of `old_parent` are cloned under `new_parent`.
+    '''
+    if isinstance(data, ODD):
+        new_data = ODD()
+        for k, v in data.items():
+            if isinstance(v, OptionBase):
+                if v._parent is old_parent:
+                    v = v.clone(new_parent)
+                    v._used = True
+                else:
+                    v = v.clone(v._parent)
+            else:
+                v = deepcopy(v)
+            new_data._set(k, v)
+        return new_data
+    # raw values are shared, see `OptionBase._own_data`
+    return data
 
 
 class Delegator:
@@ -385,36 +689,114 @@ class Delegator:
         setattr(obj, self.path[-1], value)
 
 
+# blank instance of every Option class, created at the first `cls()` call.
+_PROTOTYPES = {}
+
+# bookkeeping of every option node, children are kept in `_children`.
+# `_src` is the option whose `_data` a clone still borrows, `_borrowers` are weakrefs to such clones,
+# `_holder` is the array an item belongs to, `_json` caches json fragments of the option.
+_NODE_SLOTS = ('_parent', '_name', '_data_key', '_owner', '_data', '_used', '_as_array',
+               '_as_raw', '_shared', '_strict', '_value_choices', '_children', '_doc', '_inited',
+               '_holder', '_src', '_borrowers', '_json', '__weakref__')
+
+
+SIMILAR_CACHE_SIZE = 1024
+
+_similar_values = {}
+
+
+def _index_names(meta):
+    '''
+    build the lookup tables used by `OptionBase._get_similar_param`:
+        names: exact param/delegator names and class level aliases (e.g. `style = textStyle`)
+        candidates: names for fuzzy matching
+        similar: memo of fuzzy matched names
+    '''
+    candidates = meta['params'].key_list+meta['delegators'].key_list
+    names = dict((k, k) for k in candidates)
+    for k, v in meta['aliases'].items():
+        names.setdefault(k, v)
+    meta['names'] = names
+    meta['candidates'] = candidates
+    meta['similar'] = {}
+
+
+class InstanceDoc:
+    '''
+    `__doc__` of Option classes, returns the help text given to an instance if any.
+    '''
+
+    def __init__(self, doc=None):
+        self.doc = doc
+
+    def __get__(self, obj, owner):
+        if obj is not None and obj._doc:
+            return obj._doc
+        return self.doc
+
+
 class OptionMeta(type):
     '''
     add seperate `_meta` that holding all params and delegators to every Option class
     '''
     def __new__(cls, clsname, bases, attrs):
         attrs['_meta'] = ODD(params=ODD(), delegators=ODD())
+        # no per-instance __dict__, subclasses that need extra attributes declare their own slots
+        attrs.setdefault('__slots__', ())
+        attrs['__doc__'] = InstanceDoc(attrs.get('__doc__'))
         return super().__new__(cls, clsname, bases, attrs)
 
     def __init__(self, clsname, bases, attrs):
         super().__init__(clsname, bases, attrs)
         meta = attrs['_meta']
 
+        slots = []
+        for c in reversed(self.__mro__):
+            for k in c.__dict__.get('__slots__', ()):
+                if k not in slots and k not in _NODE_SLOTS:
+                    slots.append(k)
+        meta['extra_slots'] = tuple(slots)
+
+        aliases = {}
         for b in bases[-1::-1]:
             for k, v in b.__dict__.items():
                 if 'OptionMeta' in str(type(type(v))):
                     meta['params'][v._name] = v
+                    if k != v._name:
+                        aliases[k] = v._name
                 elif 'Delegator' in str(type(v)):
                     meta['delegators'][k] = tuple(v.path)
 
         for k, v in attrs.items():
             if 'OptionMeta' in str(type(type(v))):
                 meta['params'][v._name] = v
+                if k != v._name:
+                    aliases[k] = v._name
             elif 'Delegator' in str(type(v)):
                 meta['delegators'][k] = tuple(v.path)
 
+        meta['aliases'] = aliases
+        _index_names(meta)
+
+    def __call__(cls, *args, **kw):
+        '''
+        instances created without arguments are cloned from the class prototype, sharing its raw values until changed.
+        '''
+        if args or kw:
+            return super().__call__(*args, **kw)
+
+        proto = _PROTOTYPES.get(cls)
+        if proto is None:
+            proto = super().__call__()
+            _PROTOTYPES[cls] = proto
+        return proto.clone()
+
 
 class OptionBase(metaclass=OptionMeta):
     '''
     base class for Options, acts as descritor and data carrier.
     '''
+    __slots__ = _NODE_SLOTS
     PARAM_THRESHOLD = 1/3
 
     def __init__(self, value_choices=[], __doc__=None, data_key=None):
@@ -426,10 +808,15 @@ class OptionBase(metaclass=OptionMeta):
         self._used = False
         self._as_array = False
         self._as_raw = False
+        self._shared = False
+        self._strict = None
         self._value_choices = value_choices
-
-        for k, v in self._meta.params.items():
-            self.__dict__[k] = v.clone(self)
+        self._children = None
+        self._doc = None
+        self._holder = None
+        self._src = None
+        self._borrowers = None
+        self._json = None
 
         doc = ''
 
@@ -440,7 +827,7 @@ class OptionBase(metaclass=OptionMeta):
         if self._value_choices:
             doc += '\n\n\tavailable choices:\n\t'+str(self._value_choices)
         if doc:
-            self.__doc__ = doc
+            self._doc = doc
         self._inited = True
 
     def __bool__(self):
@@ -461,7 +848,7 @@ class OptionBase(metaclass=OptionMeta):
 
     def __get__(self, obj, owner):
         if isinstance(obj, OptionBase):
-            return obj.__dict__[self._name]
+            return obj._get_child(self)
         else:
             return self
 
@@ -476,12 +863,18 @@ class OptionBase(metaclass=OptionMeta):
 
     # act as data carrier
     def __getattr__(self, attr):
-        if attr.startswith('__'):
-            raise CustomAttributeError(self, attr)
+        if attr.startswith('_'):
+            # bookkeeping not set yet, e.g. while copying, don't repr self here
+            raise AttributeError(attr)
+
+        # params added by `add_param` have no descriptor on the class
+        param = self._meta.params.get(attr)
+        if param is not None:
+            return self._get_child(param)
 
         if self._as_raw:
             try:
-                ret = getattr(self._data, attr)
+                ret = getattr(self._own_data(), attr)
                 if attr in ['append', 'insert', 'add', 'update']:
                     self.use()
                 return ret
@@ -514,7 +907,13 @@ class OptionBase(metaclass=OptionMeta):
         return len(self._data)
 
     def __getitem__(self, key):
-        return self._data[key]
+        if self._src is not None:
+            self._unborrow()
+        value = self._data[key]
+        if not isinstance(value, OptionBase) and not _is_immutable(value):
+            # may be changed in place by the caller: copy it if shared with clones, drop json caches
+            value = self._own_data()[key]
+        return value
 
     def __setitem__(self, key, val):
         if isinstance(val, OptionBase):
@@ -524,14 +923,142 @@ class OptionBase(metaclass=OptionMeta):
             if len(self._data) > 0:
                 self._data[-1][key] = val
         else:
-            self._data[key] = val
+            self._own_data()[key] = val
         self.use()
 
+    def _get_child(self, param):
+        '''
+        return the child option of `param`, it's created on first access:
+        adopted from `_data` if it's there already (e.g. after clone), else cloned from the class level template.
+        '''
+        children = self._children
+        if children is None:
+            children = self._children = {}
+        if self._src is not None:
+            self._unborrow()
+
+        name = param._name
+        ins = children.get(name)
+        if ins is None:
+            if not self._as_array and isinstance(self._data, ODD):
+                v = self._data.get(param._get_data_key())
+                if isinstance(v, OptionBase) and v._parent is self:
+                    ins = v
+            if ins is None:
+                ins = param.clone(self)
+                ins._strict = self._strict
+            children[name] = ins
+        return ins
+
+    def _reset_children(self):
+        '''
+        forget materialized children, they will be created again from `_data` or templates on next access.
+        '''
+        self._children = None
+
+    def _lend(self, borrower):
+        borrowers = self._borrowers
+        if borrowers is None:
+            borrowers = self._borrowers = []
+        elif len(borrowers) % 32 == 0:  # forget collected clones
+            borrowers[:] = [r for r in borrowers if r() is not None]
+        borrowers.append(weakref.ref(borrower))
+
+    def _unborrow(self):
+        '''
+        take an own copy of the borrowed `_data`, children are cloned lazily again.
+        '''
+        src = self._src
+        if src is not None:
+            self._src = None
+            self._data = _clone_data(self._data, src, self)
+
+    def _before_write(self):
+        '''
+        called before changing self or its `_data`: json caches of self and its ancestors are dropped,
+        clones borrowing from them take their copies first.
+        '''
+        if self._src is not None:
+            self._unborrow()
+        lent = False
+        node = self
+        while isinstance(node, OptionBase):
+            node._json = None
+            if node._borrowers:
+                lent = True
+            node = node._holder if node._parent is None else node._parent
+        if not lent:
+            return
+
+        path = []
+        node = self
+        while isinstance(node, OptionBase):
+            path.append(node)
+            node = node._holder if node._parent is None else node._parent
+        # from top down, clones made by splitting an ancestor borrow from the nodes below
+        for node in reversed(path):
+            borrowers = node._borrowers
+            if borrowers:
+                node._borrowers = None
+                for r in borrowers:
+                    b = r()
+                    if b is not None and b._src is node:
+                        b._unborrow()
+
+    def _own_data(self):
+        '''
+        raw value is shared between clones, copy it before changing it in place.
+        '''
+        self._before_write()
+        if self._shared:
+            self._data = _copy_value(self._data)
+            self._shared = False
+        return self._data
+
+    def _is_strict(self):
+        '''
+        `_strict` of self or the nearest ancestor having it, so options added or adopted later follow the chart.
+        '''
+        node = self
+        while isinstance(node, OptionBase):
+            if node._strict is not None:
+                return node._strict
+            node = node._holder if node._parent is None else node._parent
+        return CONFIG.STRICT_PARAMS
+
     def _get_similar_param(self, param):
-        return similar_param(param, self._meta['params'].key_list+self._meta['delegators'].key_list, self.PARAM_THRESHOLD)
+        meta = self._meta
+        names = meta['names']
+        if param in names:
+            return names[param]
+        if self._is_strict():
+            if param in ['type_', 'min_', 'max_']:
+                return param[:-1]
+            return param
+
+        memo = meta['similar']
+        if param not in memo:
+            if len(memo) >= SIMILAR_CACHE_SIZE:
+                memo.clear()
+            memo[param] = similar_param(param, meta['candidates'], self.PARAM_THRESHOLD)
+        return memo[param]
 
     def _get_similar_value(self, value):
-        return similar_param(value, self._value_choices, self.PARAM_THRESHOLD)
+        choices = self._value_choices
+        if choices and self._is_strict():
+            return value
+        if not isinstance(value, str):  # e.g. numpy arrays can't be compared with choices
+            return value
+        if not choices:
+            return similar_param(value, choices, self.PARAM_THRESHOLD)
+
+        key = (value, id(choices), self.PARAM_THRESHOLD)
+        cached = _similar_values.get(key)
+        if cached is None or cached[0] is not choices:
+            if len(_similar_values) >= SIMILAR_CACHE_SIZE:
+                _similar_values.clear()
+            cached = _similar_values[key] = (choices, similar_param(value, choices, self.PARAM_THRESHOLD))
+        return cached[1]
 
     def set(self, value, obj=None):
         if self._value_choices:
@@ -544,9 +1071,11 @@ class OptionBase(metaclass=OptionMeta):
 
         obj = obj or self._parent
         if isinstance(obj, OptionBase):
-            ins = obj.__dict__[self._name]
+            ins = obj._get_child(self)
             if value is not ins:
+                ins._before_write()
                 ins._data = value
+                ins._shared = False
             ins.use()
         else:
             if value is not ins:
@@ -554,25 +1083,115 @@ class OptionBase(metaclass=OptionMeta):
             self.use()
 
     def clone(self, new_parent=None):
-        obj = type(self)()
-
-        if isinstance(self._data, ODD):
-            obj._data = self._data.clone()
+        '''
+        clone option tree, objects are shared with the clone until either side changes them.
+        '''
+        obj = self._copy_node(new_parent)
+        data = self._data
+        if isinstance(data, ODD) and not self._as_array and not self._as_raw:
+            src = self._src or self
+            obj._data = data
+            obj._src = src
+            src._lend(obj)
         else:
-            obj._data = deepcopy(self._data)
-        obj._parent = new_parent
+            obj._data = _clone_data(data, self, obj)
+            if obj._data is data and not _is_immutable(data):
+                self._shared = obj._shared = True
+            elif self._as_array:
+                for v in obj._data.value_list:
+                    if isinstance(v, OptionBase):
+                        v._holder = obj
+
+        return obj
+
+    def __getstate__(self):
+        '''
+        pickle the option tree without json caches and clone bookkeeping.
+        '''
+        data = self._data
+        if self._src is not None:
+            # children in borrowed data belong to the source, pickle own copies of them
+            data = _clone_data(data, self._src, self)
+        extra = None
+        for k in self._meta.extra_slots:
+            try:
+                v = getattr(self, k)
+            except AttributeError:
+                continue
+            if extra is None:
+                extra = {}
+            extra[k] = v
+        return (self._parent, self._name, self._data_key, self._owner, data, self._used, self._as_array,
+                self._as_raw, self._shared, self._strict, self._value_choices, self._doc, self._holder, extra)
+
+    def __setstate__(self, state):
+        (self._parent, self._name, self._data_key, self._owner, self._data, self._used, self._as_array,
+         self._as_raw, self._shared, self._strict, self._value_choices, self._doc, self._holder, extra) = state
+        self._children = None
+        self._src = None
+        self._borrowers = None
+        self._json = None
+        self._inited = True
+        if extra:
+            for k, v in extra.items():
+                setattr(self, k, v)
+
+    def _copy_node(self, new_parent=None):
+        '''
+        copy settings of self without data
+        '''
+        cls = type(self)
+        obj = cls.__new__(cls)
+
         obj._name = self._name
         obj._data_key = self._data_key
+        obj._owner = self._owner
         obj._as_array = self._as_array
         obj._as_raw = self._as_raw
+        obj._strict = self._strict
         obj._value_choices = self._value_choices
+        obj._doc = self._doc
+        obj._inited = self._inited
+        for k in self._meta.extra_slots:
+            try:
+                v = getattr(self, k)
+            except AttributeError:
+                continue
+            if isinstance(v, (list, dict, set)):
+                v = v.copy()
+            setattr(obj, k, v)
+
+        obj._children = None
+        obj._parent = new_parent
+        obj._used = False
+        obj._shared = False
+        obj._holder = None
+        obj._src = None
+        obj._borrowers = None
+        obj._json = None if self._json is None else self._json.copy()
+        obj._data = None
+        return obj
 
+    def _new_item(self):
+        '''
+        new array item copied from the last one, same as self.clone().to_object() without copying all items
+        '''
+        obj = self._copy_node()
+        obj._as_array = False
+        obj._json = None
+        obj._data = ODD()
+        if len(self._data) > 0:
+            last = self._data[-1]
+            obj._data = _clone_data(last._data, last._src or last, obj)
+            if obj._data is last._data and not _is_immutable(last._data):
+                last._shared = obj._shared = True
         return obj
 
     def use(self):
         parent = self._parent
         if isinstance(parent, OptionBase) and not self._used:
             parent.use()
+            parent._before_write()
             parent._data[self._get_data_key()] = self
             self._used = True
 
@@ -587,13 +1206,13 @@ class OptionBase(metaclass=OptionMeta):
     def unuse(self):
         parent = self._parent
         if isinstance(parent, OptionBase) and self._used:
+            parent._before_write()
             parent._data.pop(self._get_data_key())
             self._used = False
         return self._parent
 
     def _parse_kw(self, kw):
         d = {}
-        params = self._meta['params'].key_list
 
         for k, v in kw.items():
             k = self._get_similar_param(k)
@@ -615,19 +1234,21 @@ class OptionBase(metaclass=OptionMeta):
             d.update(kw)
 
             for k, v in d.items():
-                if k in obj._meta.params.key_list+obj._meta.delegators.key_list:
+                if k in obj._meta['names']:
                     getattr(obj, k).set(v)
                 else:
-                    obj._data.update({k: v})
+                    obj._own_data().update({k: v})
         return obj
 
     def to_array(self, preserve_value=True):
         if not self._as_array:
+            self._before_write()
             new_data = ODD()
             obj = self.clone()  # todo: set attribute of array element will not use parent automaticlly
+            obj._holder = self
             if preserve_value:
                 key = None
-                if isinstance(self._data, ODD) and 'name' in self._data.key_list:
+                if isinstance(self._data, ODD) and 'name' in self._data:
                     key = self._data['name']
                 new_data.add(obj, key)
             self._data = new_data
@@ -636,22 +1257,23 @@ class OptionBase(metaclass=OptionMeta):
 
     def to_object(self, preserve_value=-1):
         if self._as_array:
+            self._before_write()
             new_data = ODD()
             if len(self._data) > 0 and preserve_value is not None:
                 obj = self._data[preserve_value]
-                new_data.update(deepcopy(obj._data))
-                for k, v in obj._data.items():
-                    if isinstance(v, OptionBase):
-                        v._parent = self
+                new_data = _clone_data(obj._data, obj._src or obj, self)
             self._data = new_data
             self._as_array = False
+            self._reset_children()
         return self
 
     def to_raw(self, value=None):
         if not self._as_raw:
+            self._before_write()
             self._as_raw = True
             value = value or self._data or value
             self._data = value
+            self._shared = False
             self.use()
         return self
 
@@ -662,13 +1284,17 @@ class OptionBase(metaclass=OptionMeta):
         if isinstance(d, Option) and not kw:
             val = d
         else:
-            val = self.clone().to_object()
+            val = self._new_item()
             val.opts(d, **kw)
 
         key = None
-        if 'name' in val._data.key_list:
+        if 'name' in val._data:
             key = val._data['name']
 
+        self._before_write()
+        if val._holder is not None and val._holder is not self:
+            val._holder._before_write()  # the other array no longer hears of changes of val
+        val._holder = self
         self._data.add(val, key)
         return self
 
@@ -679,24 +1305,21 @@ class OptionBase(metaclass=OptionMeta):
     #         return self.add(*args, **kw)
 
     def remove(self, key=-1):
-        self._data.pop(key)
+        self._own_data().pop(key)
         return self
 
     def clear(self, unuse=False):
-        parsed = []
-
-        for k, v in self._meta['params'].items():
-            ins = self.__dict__[k]
+        '''
+        replace used children with new ones from the class level templates.
+        '''
+        for param in self._meta['params'].value_list:
+            ins = self._get_child(param)
             if ins._used:
-                if v not in parsed:
-                    parsed.append(v)
-                    ins = v.clone()
-                    ins._parent = self
-                    self.__dict__[k] = ins
-                    if unuse:
-                        self.unuse()
-                else:
-                    self.__dict__[k] = self.__dict__[v._name]
+                new = param.clone(self)
+                new._strict = self._strict
+                self._children[param._name] = new  # not adopted from `_data` again
+                if unuse:
+                    self.unuse()
 
     @classmethod
     def delegate(cls, target, new_names={}, prefix=''):
@@ -713,11 +1336,13 @@ class OptionBase(metaclass=OptionMeta):
             d = Delegator(target._name, k)
             setattr(cls, n, d)
             cls._meta.delegators[n] = d
+        _index_names(cls._meta)
 
     def add_param(self, name, param):
         param._name = name
         self._meta.params[name] = param
-        self.__dict__[name] = param.clone(self)
+        _index_names(self._meta)
+        self._get_child(param)
 
 
 class RawOption(OptionBase):
@@ -730,7 +1355,7 @@ class RawOption(OptionBase):
         self.to_raw(value)
 
     def __repr__(self):
-        if '_inited' in self.__dict__:
+        if getattr(self, '_inited', False):
             return '{}({})'.format(self.__class__.__name__, self._data.__repr__())
         return super().__repr__()
 
@@ -750,7 +1375,7 @@ class Option(OptionBase):
         self.opts(d, **kw)
 
     def __repr__(self):
-        if '_inited' in self.__dict__:
+        if getattr(self, '_inited', False):
             if self._as_array:
                 name = self.__class__.__name__+'Array'
                 text = self._data.value_list.__repr__()
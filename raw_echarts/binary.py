@@ -0,0 +1,142 @@
+'''
+write numeric series data as base64 Float32/Float64 buffers in the page instead of decimal json,
+a small js function rebuilds the nested arrays before `setOption`.
+payloads are 3-4 times smaller, and both python and the browser skip formatting/parsing decimals.
+'''
+import sys
+import base64
+from raw_echarts.bases import *
+
+
+__all__ = ['PackedData', 'pack_values', 'DECODE_JS', 'DTYPES']
+
+
+# (base64, dtype, shape) -> nested arrays like the data packed
+DECODE_JS = ('(function(b,t,s){var d=atob(b),u=new Uint8Array(d.length),i,k=0;'
+             'for(i=0;i<d.length;i++)u[i]=d.charCodeAt(i);'
+             'var a=t=="f4"?new Float32Array(u.buffer):new Float64Array(u.buffer),m=s.length-1;'
+             'function r(l){var n=s[l],o=new Array(n),j;'
+             'if(l==m){for(j=0;j<n;j++)o[j]=a[k++];}else{for(j=0;j<n;j++)o[j]=r(l+1);}return o;}'
+             'return r(0);})')
+
+# dtype -> array typecode, both little endian in the page
+DTYPES = {'f4': 'f', 'f8': 'd'}
+
+# integers above are not exact in Float32Array, f4 data with larger values (e.g. timestamps in ms) is packed as f8
+F4_EXACT = 2**24
+
+
+def _is_number(v):
+    return isinstance(v, (int, float)) and not isinstance(v, bool) or np is not None and isinstance(v, np.number)
+
+
+def _shape_python(data):
+    '''
+    shape of nested lists of numbers and the flat values, None if they are not
+    '''
+    if len(data) and isinstance(data[0], (list, tuple)):
+        width = len(data[0])
+        values = []
+        for row in data:
+            if not isinstance(row, (list, tuple)) or len(row) != width:
+                return None
+            values.extend(row)
+        shape = [len(data), width]
+    else:
+        values = data
+        shape = [len(data)]
+    for v in values:
+        if v is not None and not _is_number(v):
+            return None
+    return shape, [float('nan') if v is None else v for v in values]
+
+
+def pack_values(data, dtype='f4'):
+    '''
+    (base64 text, shape, dtype) of numeric data, missing values are written as NaN.
+    'f4' falls back to 'f8' if any value is larger than F4_EXACT.
+    None if data is not numbers in a regular shape, e.g. has category names or data items as dicts.
+    '''
+    if dtype not in DTYPES:
+        raise ValueError(f'dtype should be one of {list(DTYPES)}, not {dtype!r}')
+    if np is not None:
+        try:
+            a = np.asarray(data)
+        except ValueError:  # ragged rows
+            return None
+        if a.dtype.kind == 'O':  # with None, numbers like '1' are not taken as numbers
+            if not all(v is None or _is_number(v) for v in a.flat):
+                return None
+        elif a.dtype.kind not in 'iuf':
+            return None
+        if a.size == 0:
+            return None
+        a = a.astype('<f8')
+        if dtype == 'f4' and not (np.abs(a) > F4_EXACT).any():
+            a = a.astype('<f4')
+        else:
+            dtype = 'f8'
+        return base64.b64encode(a.tobytes()).decode(), list(a.shape), dtype
+
+    if isinstance(data, array):
+        data = data.tolist()
+    shaped = _shape_python(data)
+    if shaped is None or not shaped[1]:
+        return None
+    shape, values = shaped
+    if dtype == 'f4' and any(abs(v) > F4_EXACT for v in values):
+        dtype = 'f8'
+    a = array(DTYPES[dtype], values)
+    if sys.byteorder == 'big':
+        a.byteswap()
+    return base64.b64encode(a.tobytes()).decode(), shape, dtype
+
+
+class PackedData(LazyValue):
+    '''
+    series data written as a base64 typed array decoded in the browser, or as it is if it's not numeric.
+    dtype: 'f4' (Float32Array, about 7 significant digits) or 'f8' (Float64Array, exact).
+        'f4' data with values larger than 2**24, e.g. timestamps, is packed as 'f8' to keep them.
+    '''
+
+    def __init__(self, data, dtype='f4'):
+        if dtype not in DTYPES:
+            raise ValueError(f'dtype should be one of {list(DTYPES)}, not {dtype!r}')
+        self.data = data
+        self.dtype = dtype
+
+    def __repr__(self):
+        data = self.data
+        return 'PackedData({}, {!r})'.format(data if isinstance(data, LazyValue) else len(data), self.dtype)
+
+    def __len__(self):
+        return len(self.data)
+
+    def value(self):
+        data = self.data
+        if isinstance(data, LazyValue):  # e.g. sampled data
+            data = data.value()
+        packed = pack_values(data, self.dtype)
+        if packed is None:
+            return data
+        text, shape, dtype = packed
+        return JsCode('{}("{}","{}",{})'.format(DECODE_JS, text, dtype, shape))
+
+
+class PackDataMixin:
+    __slots__ = ()
+
+    def pack_data(self, dtype='f4'):
+        '''
+        write numeric data as a base64 typed array, see `PackedData`.
+        '''
+        data = self.data._own_data()  # the data is kept, not shared with clones
+        if isinstance(data, PackedData):
+            data = data.data
+        self.data.set(PackedData(data, dtype))
+        return self
+
+
+if __name__ == '__main__':
+    print(PackedData([[1, 2.5], [3, None]]).value().js)
+    print(PackedData(['a', 'b']).value())
@@ -1,6 +1,6 @@
 import re
-from lxml import etree
-from io import StringIO
+from itertools import chain
+from io import StringIO, TextIOBase, RawIOBase, BufferedIOBase
 from raw_echarts.elements import *
 from raw_echarts.layouts import *
 from raw_echarts.axis import *
@@ -9,6 +9,90 @@ from raw_echarts.toolbox import *
 from raw_echarts.graphics import *
 from raw_echarts.series import *
 from raw_echarts.series3D import *
+from raw_echarts import serializer, frames, tuning, streaming
+from raw_echarts.diff import option_delta
+
+
+def escape_text(s):
+    '''
+    escape html text, non ascii characters as character references like lxml does
+    '''
+    s = str(s).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    return s.encode('ascii', 'xmlcharrefreplace').decode('ascii')
+
+
+def escape_attr(s):
+    return escape_text(s).replace('"', '&quot;')
+
+
+def _is_binary(fp):
+    '''
+    whether file like `fp` takes bytes
+    '''
+    if isinstance(fp, TextIOBase):
+        return False
+    if isinstance(fp, (RawIOBase, BufferedIOBase)):
+        return True
+    return 'b' in str(getattr(fp, 'mode', ''))
+
+
+def encode_chunks(chunks, encoding=None):
+    '''
+    encode str chunks to bytes if `encoding` is given
+    '''
+    if encoding is None:
+        return chunks
+    return (x.encode(encoding) for x in chunks)
+
+
+def html_parts(title, scripts, compact=False):
+    '''
+    html document before and after the body content, `scripts` are put in head.
+    '''
+    sep = '' if compact else '\n'
+    head = sep.join([
+        '<!DOCTYPE html>\n<html>',
+        '<head>',
+        '<meta charset="UTF-8">',
+        '<meta name="viewport" content="width=device-width, initial-scale=1">',
+        '<meta name="theme-color" content="#000000">',
+        '<meta name="description" content="Awesome ECharts">',
+        f'<title>{escape_text(title or "")}</title>',
+        scripts,
+        '</head>',
+        '<body>',
+        '<noscript>you should enable javascript to run this app.</noscript>',
+    ])+sep
+    # the body content ends with a new line already if not compact
+    tail = sep.join(['</body>', '</html>'])+sep
+    return head, tail
+
+
+def html_path(path):
+    '''
+    path of the html file written for `path`, with .html added if it's not there
+    '''
+    if not path.endswith('.html'):
+        path += '.html'
+    return path
+
+
+def write_html(file, iter_html):
+    '''
+    write html chunks to a path (see `html_path`) or file like object.
+    iter_html: function(encoding) yielding the chunks, in bytes if encoding is not None.
+    '''
+    if isinstance(file, str):
+        with open(html_path(file), 'w', encoding='utf-8') as fp:
+            for chunk in iter_html(None):
+                fp.write(chunk)
+    elif hasattr(file, 'write'):
+        encoding = 'utf-8' if _is_binary(file) else None
+        for chunk in iter_html(encoding):
+            file.write(chunk)
+        # rewind to read the html back, e.g. from a StringIO
+        if getattr(file, 'readable', None) and file.readable() and file.seekable():
+            file.seek(0)
 
 
 class NotebookRender:
@@ -261,20 +345,22 @@ class Root(AnimationMixin, Option):
     visualMap = VisualMap()
     dataZoom = DataZoom()
 
+    dataset = DataSet().to_array(False)
+
     def __init__(self, **kw):
         super().__init__(**kw)
         # self.xAxis.use()
         # self.yAxis.use()
 
 
-class DataSet:
-    pass
-
-
 class Chart:
-    def __init__(self, chart_id=None, width=600, height=400):
+    def __init__(self, chart_id=None, width=600, height=400, strict=None):
+        '''
+        strict: only accept exact param names for this chart, None to follow `CONFIG.STRICT_PARAMS`.
+        '''
         self.chart_id = chart_id or str(id(self))
         self._option = Root()
+        self._option._strict = strict
         self.width = self.parse_size(width)
         self.height = self.parse_size(height)
         # self.set_colors([
@@ -304,31 +390,32 @@ class Chart:
         #     "#918597"
         # ])
         self._js_dependences = []
+        self._pushed_option = None  # option sent by the last `update_option`
+        self.precision = None  # of floats in json, see `set_precision`
+        self._data_batch = None  # chunks of `append_data` not sent yet
         self.notebook = NotebookRender()
 
     def __getitem__(self, key):
         return self._option[key]
 
     def __getattr__(self, attr):
+        if attr == '_option':  # not set yet, e.g. while unpickling
+            raise AttributeError(attr)
         if hasattr(self._option, attr):
             return getattr(self._option, attr)
         raise AttributeError(f'"{self}" object has no attribute: "{attr}"')
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('notebook', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.notebook = NotebookRender()
+
     def get_option(self):
-        def _p(v):
-            if isinstance(v, RawOption):
-                return _p(v._data)
-            if isinstance(v, Option):
-                if v._as_array and isinstance(v._data, ODD):
-                    return [_p(x) for x in v._data.value_list]
-                else:
-                    return _p(v._data)
-            if isinstance(v, list):
-                return [_p(x) for x in v]
-            if isinstance(v, (dict, ODD)):
-                return dict([(v._get_data_key() if isinstance(v, OptionBase) else _p(k), _p(v)) for k, v in v.items()])
-            return v
-        return _p(self._option._data)
+        return to_plain(self._option._data)
 
     def parse_size(self, v):
         if isinstance(v, int):
@@ -348,76 +435,109 @@ class Chart:
     def set_colors(self, colors=[]):
         self.opts(color=colors)
 
-    def to_json(self):
-        return dumps(self.get_option())
+    def set_precision(self, digits=None, decimals=None):
+        '''
+        write floats in series data, mark point coords, axis bounds etc (see `serializer.ROUNDED_KEYS`)
+        with `digits` significant digits or `decimals` fixed decimals, stored data is not changed.
+        series may have their own by `Series.set_precision`.
+        it's applied by the built-in json writer, not the other `CONFIG.JSON_BACKEND`s.
+        '''
+        self.precision = serializer.parse_precision(digits, decimals)
+        return self
+
+    def _is_compact(self, compact=None):
+        if compact is None:
+            return bool(CONFIG.COMPACT_OUTPUT)
+        return compact
+
+    def to_json(self, indent=4, compact=None):
+        '''
+        compact: no indent and spaces, None to follow `CONFIG.COMPACT_OUTPUT`.
+        '''
+        separators = None
+        if self._is_compact(compact):
+            indent, separators = None, COMPACT_SEPARATORS
+        if CONFIG.JSON_BACKEND is None:
+            return serializer.dumps(self._option, indent=indent, separators=separators, cache=bool(CONFIG.CACHE_JSON),
+                                    precision=self.precision)
+        return dumps(self.get_option(), indent=indent, separators=separators)
+
+    def write_json(self, fp, indent=4, compact=None):
+        '''
+        write option json to file like `fp` in chunks.
+        '''
+        separators = None
+        if self._is_compact(compact):
+            indent, separators = None, COMPACT_SEPARATORS
+        serializer.dump(self._option, fp, indent=indent, separators=separators, cache=bool(CONFIG.CACHE_JSON),
+                        precision=self.precision)
 
     def clone(self):
         obj = type(self)(width=self.width, height=self.height)
         obj._option = self._option.clone()
         obj._js_dependences = self._js_dependences.copy()
+        obj.precision = self.precision
         return obj
 
-    def render_embed(self):
-        root = etree.Element('div', {'id': f'{self.chart_id}_container'})
-        div = etree.Element('div', {'id': self.chart_id, 'class': 'chart-container', 'style': f'width:{self.width};height:{self.height};'})
-        script = etree.Element('script')
-        script.text = f'''
-        var chart_{self.chart_id}=echarts.init(document.getElementById("{self.chart_id}"),"white",{{"renderer":"canvas"}});
-        var option_{self.chart_id}={self.to_json()};
-        chart_{self.chart_id}.setOption(option_{self.chart_id});
-        '''
-        div.append(script)
-        root.append(div)
-        content = etree.tostring(
-            root, method='HTML', pretty_print=True).decode()
-        return content
-
-    def render_file(self, file=None, title='Awesome Echarts'):
-        root = etree.HTML('<html/>')
-
-        head = etree.Element('head')
-        metas = [
-            etree.Element('meta', charset='UTF-8'),
-            etree.Element('meta', name='viewport',
-                          content='width=device-width, initial-scale=1'),
-            etree.Element('meta', name='theme-color', content='#000000'),
-            etree.Element('meta', name='description',
-                          content='Awesome ECharts')
-        ]
-        t = etree.Element('title')
-        t.text = title
-        script = etree.Element('script', {
-                               'type': 'text/javascript', 'src': CONFIG.ECHARTS_ASSETS+'/echarts.min.js'})
-        for m in metas:
-            head.append(m)
-        head.append(t)
-        head.append(script)
-
-        for js in self._js_dependences:
-            head.append(etree.Element(
-                'script', {'type': 'text/javascript', 'src': js}))
-
-        body = etree.Element('body')
-        noscript = etree.Element('noscript')
-        noscript.text = 'you should enable javascript to run this app.'
-        body.append(noscript)
-        body.append(etree.fromstring(self.render_embed()))
-
-        root.append(head)
-        root.append(body)
-        content = etree.tostring(
-            root, method='HTML', pretty_print=True).decode()
-        content = '<!DOCTYPE html>\n'+content
-
-        if isinstance(file, str):
-            if not file.endswith('.html'):
-                file += '.html'
-            with open(file, 'w', encoding='utf-8') as fp:
-                fp.write(content)
-        elif hasattr(file, 'write'):
-            file.write(content)
-            file.seek(0)
-        return content
+    def _embed_parts(self, compact=False):
+        '''
+        html of `render_embed` before and after the option json
+        '''
+        cid = self.chart_id
+        div = '<div id="{0}_container"><div id="{0}" class="chart-container" style="{1}"><script>'.format(
+            escape_attr(cid), escape_attr(f'width:{self.width};height:{self.height};'))
+        init = f'var chart_{cid}=echarts.init(document.getElementById("{cid}"),"white",{{"renderer":"canvas"}});'
+        if compact:
+            return (f'{div}{init}var option_{cid}=',
+                    f';chart_{cid}.setOption(option_{cid});</script></div></div>')
+        return (f'{div}\n        {init}\n        var option_{cid}=',
+                f';\n        chart_{cid}.setOption(option_{cid});\n        </script></div></div>\n')
+
+    def _file_parts(self, title='Awesome Echarts', compact=False):
+        '''
+        html of `render_file` before and after `render_embed`
+        '''
+        scripts = ''.join([f'<script type="text/javascript" src="{escape_attr(js)}"></script>'
+                           for js in [CONFIG.ECHARTS_ASSETS+'/echarts.min.js']+self._js_dependences])
+        return html_parts(title, scripts, compact)
+
+    def render_embed(self, compact=None):
+        compact = self._is_compact(compact)
+        before, after = self._embed_parts(compact)
+        return before+self.to_json(compact=compact)+after
+
+    def _iter_json(self, compact=False):
+        '''
+        yield the option json of `render_embed` in chunks
+        '''
+        indent, separators = (None, COMPACT_SEPARATORS) if compact else (4, None)
+        # cached json is reused, but new one is not kept, which would hold it back until it's done
+        writer = serializer.JsonWriter(indent=indent, separators=separators, cache='read' if CONFIG.CACHE_JSON else False,
+                                       precision=self.precision)
+        return writer.iterencode(self._option)
+
+    def iter_html(self, title='Awesome Echarts', compact=None, encoding=None):
+        '''
+        yield the html of `render_file` in chunks, the option json is encoded while iterating.
+        encoding: yield bytes in this encoding instead of str, e.g. for wsgi responses.
+        '''
+        compact = self._is_compact(compact)
+        head, tail = self._file_parts(title, compact)
+        before, after = self._embed_parts(compact)
+        return encode_chunks(chain([head, before], self._iter_json(compact), [after, tail]), encoding)
+
+    def render_file(self, file=None, title='Awesome Echarts', compact=None):
+        '''
+        return the html if `file` is None.
+        file: path or file like object to write the html to, which is written in chunks and not returned then.
+            None is returned, unlike former versions that returned the html too (see CHANGELOG.md).
+        binary file objects (e.g. `gzip.open(path, 'wb')`, `socket.makefile('wb')`) get utf-8 bytes.
+        '''
+        if file is None:
+            compact = self._is_compact(compact)
+            head, tail = self._file_parts(title, compact)
+            return head+self.render_embed(compact=compact)+tail
+        write_html(file, lambda encoding: self.iter_html(title, compact, encoding))
 
     def render_notebook(self):
         obj = self.clone()
@@ -427,6 +547,74 @@ class Chart:
     def setOption(self, option, notMerge=False, lazyUpdate=False):
         self.call_js('setOption', option, notMerge, lazyUpdate)
 
+    def option_delta(self, commit=True):
+        '''
+        (delta, notMerge) for `setOption` since the last committed option, see `diff.option_delta`.
+        the whole option is returned with notMerge=True at the first time.
+        pending chunks of `append_data` are sent first when committing, so they are not in the delta too.
+        '''
+        if commit:
+            self.flush_data()
+        option = self.get_option()
+        delta, not_merge = option_delta(self._pushed_option, option)
+        if commit:
+            self._pushed_option = option
+        return delta, not_merge
+
+    def update_option(self, lazyUpdate=False):
+        '''
+        send changes since the last update to the rendered chart only.
+        '''
+        delta, not_merge = self.option_delta()
+        if delta is not None:
+            self.setOption(delta, not_merge, lazyUpdate)
+        return self
+
+    def batch_data(self, max_points=10000, max_delay=1.0):
+        '''
+        send chunks of `append_data` when they have `max_points` points or the oldest waits `max_delay` seconds,
+        pending chunks are sent first. see `streaming.DataBatch`.
+        '''
+        self.flush_data()
+        self._data_batch = streaming.DataBatch(self._send_data, max_points, max_delay)
+        return self
+
+    def append_data(self, series_index, chunk, flush=False):
+        '''
+        append points of `chunk` to data of the series at `series_index`,
+        and send only them to the rendered chart by `appendData` in batches (see `batch_data`).
+        `update_option` doesn't send the whole data again then.
+        flush: send pending chunks now.
+        '''
+        if series_index < 0:
+            series_index += len(self.series)
+        self.series[series_index].append_data(chunk)
+        if self._data_batch is None:
+            self._data_batch = streaming.DataBatch(self._send_data)
+        self._data_batch.add(series_index, chunk)
+        if flush:
+            self._data_batch.flush()
+        return self
+
+    def flush_data(self, due=False):
+        '''
+        send pending chunks of `append_data`, only if there are enough of them or they wait long enough with `due`,
+        e.g. called periodically by a streaming loop.
+        '''
+        if self._data_batch is not None:
+            self._data_batch.flush(due)
+        return self
+
+    def _send_data(self, series_index, data):
+        self.call_js('appendData', {'seriesIndex': series_index, 'data': data})
+        # the rendered chart has the data now, keep the last pushed option the same
+        series = (self._pushed_option or {}).get('series')
+        if series and series_index < len(series) and isinstance(series[series_index], dict):
+            pushed = series[series_index]
+            new = streaming.extend_data(pushed.get('data'), to_plain(data))
+            if new is not None:
+                pushed['data'] = new
+
     def register_map(self, name, geo_json, special_areas):
         self.notebook.run_js('echarts.registerMap({},{},{})'.format(
             name, dumps(geo_json), dumps(special_areas)))
@@ -435,7 +623,7 @@ class Chart:
         self.notebook.load_js(*self._js_dependences)
 
     def call_js(self, func, *args, **kw):
-        args = dumps(list(args))[1:-1]
+        args = dumps(list(args), indent=None, separators=COMPACT_SEPARATORS)[1:-1]
         kw = ', '.join(['{}={}'.format(k, json.dumps(v))
                         for k, v in kw.items()])
         if kw:
@@ -448,8 +636,87 @@ class Chart:
         self.opts(**kw)
         return self
 
+    @classmethod
+    def from_dataframe(cls, df, x=None, y=None, series=Line, dataset=False, dates='iso', **kw):
+        '''
+        chart of pandas DataFrame `df`, columns are extracted to numpy arrays in bulk.
+        x: column of xAxis data, None for the index.
+        y: columns of series, default to all other columns.
+        series: series class, e.g. Line, Bar.
+        dataset: put columns into a dataset that series refer to by `encode`, instead of data of every series.
+        dates: datetimes are converted to ISO strings ('iso') or epoch milliseconds ('ms').
+        a datetime x column (or index) goes to a time axis, series data are [[x, y], ...] then.
+        '''
+        if y is None:
+            y = [c for c in df.columns if c != x]
+        elif not isinstance(y, (list, tuple)):
+            y = [y]
+        chart = cls(**kw)
+        time = frames.is_time_column(df, x)
+
+        if dataset:
+            columns = frames.frame_columns(df, y, dates)
+            x_name = str(df.index.name or 'x') if x is None else str(x)
+            source = {x_name: frames.frame_column(df, x, dates)}
+            source.update(columns)
+            i = chart.add_dataset(source)
+            chart.xAxis(type='time' if time else 'category')
+            chart.yAxis.use()
+            for name in columns:
+                chart.add_chart(series(name=name).use_dataset(i, encode={'x': x_name, 'y': name}))
+        elif time:
+            chart.xAxis(type='time')
+            chart.yAxis.use()
+            for c in y:
+                chart.add_chart(series.from_frame(df, c, x=True if x is None else x, dates=dates))
+        else:
+            chart.xAxis(type='category', data=frames.frame_column(df, x, dates))
+            chart.yAxis.use()
+            for c in y:
+                chart.add_chart(series.from_frame(df, c, dates=dates))
+        return chart
+
+    def pack_data(self, dtype='f4', min_points=10000):
+        '''
+        write data of series having at least `min_points` items as base64 typed arrays, see `Series.pack_data`.
+        '''
+        for i in range(len(self.series)):
+            s = self.series[i]
+            data = s.data._data
+            if isinstance(data, LazyValue) or len(data) >= min_points:
+                s.pack_data(dtype)
+        return self
+
+    def add_dataset(self, source=None, dimensions=None, **kw):
+        '''
+        add a dataset shared by series (see `Series.use_dataset`), return its index.
+        source: DataSet, columns {dimension: values} kept in compact arrays, or rows as echarts takes.
+        '''
+        if isinstance(source, DataSet):
+            ds = source
+        elif isinstance(source, dict):
+            ds = DataSet.from_columns(source, dimensions, **kw)
+        else:
+            if dimensions is not None:
+                kw['dimensions'] = dimensions
+            ds = DataSet(source=source, **kw)
+        self.dataset.add(ds)
+        return len(self.dataset)-1
+
+    def auto_tune(self):
+        '''
+        fill in large/progressive/animation options of all series by their data volume, see `tuning.tune_series`.
+        options set by users are kept, those filled before (e.g. by `add_chart`) are updated, call it again when
+        the data grows or shrinks.
+        '''
+        for i in range(len(self.series)):
+            tuning.tune_series(self.series[i], root=self._option)
+        return self
+
     def add_chart(self, s, legend=True, icon=None, selected=True):
         self.series.add(s)
+        if CONFIG.AUTO_TUNE:
+            tuning.tune_series(s, root=self._option)
 
         if legend:
             self.legend.use()
@@ -0,0 +1,141 @@
+'''
+minimal option updates for `setOption` with echarts merge semantics:
+    - components (series, xAxis, ...) are arrays merged item by item, by id/name or by index.
+    - plain objects in a component are merged key by key.
+    - other values (including arrays like `data`) are replaced as a whole.
+    - nothing can be removed by merging, the whole option is sent with notMerge then.
+'''
+
+
+__all__ = ['option_delta']
+
+
+COMPONENTS = frozenset([
+    'title', 'legend', 'grid', 'xAxis', 'yAxis', 'polar', 'radiusAxis', 'angleAxis', 'radar',
+    'dataZoom', 'visualMap', 'tooltip', 'axisPointer', 'toolbox', 'brush', 'geo', 'parallel',
+    'parallelAxis', 'singleAxis', 'single', 'timeline', 'graphic', 'calendar', 'dataset', 'aria', 'series',
+    'globe', 'geo3D', 'mapbox3D', 'grid3D', 'xAxis3D', 'yAxis3D', 'zAxis3D',
+])
+
+# options with these keys are not merged
+_NOT_MERGEABLE = ['baseOption', 'options', 'media']
+
+
+class _Unmergeable(Exception):
+    pass
+
+
+def _same(a, b):
+    '''
+    a == b for plain options, which may contain numpy arrays that don't compare to a bool
+    '''
+    try:
+        return bool(a == b)
+    except ValueError:
+        pass
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_same(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(map(_same, a, b))
+    if hasattr(a, 'shape') and hasattr(b, 'shape'):
+        return a.shape == b.shape and a.dtype == b.dtype and bool((a == b).all())
+    return False
+
+
+def option_delta(old, new):
+    '''
+    return (delta, not_merge) to update a chart showing `old` to `new`, both are plain options from `Chart.get_option`.
+    delta is None if nothing changed, it's the whole `new` with not_merge=True if the change can't be merged.
+    '''
+    if old is None or any(k in old or k in new for k in _NOT_MERGEABLE):
+        if _same(old, new):
+            return None, False
+        return new, True
+
+    try:
+        delta = _option_delta(old, new)
+    except _Unmergeable:
+        return new, True
+    return delta or None, False
+
+
+def _option_delta(old, new):
+    for k in old:
+        if k not in new:
+            raise _Unmergeable(k)
+
+    delta = {}
+    for k, v in new.items():
+        if k not in old:
+            delta[k] = v
+        elif not _same(old[k], v):
+            if k in COMPONENTS:
+                delta[k] = _components_delta(old[k], v)
+            else:
+                delta[k] = v
+    return delta
+
+
+def _as_list(v):
+    if isinstance(v, list):
+        return v
+    return [v]
+
+
+def _components_delta(old, new):
+    old, new = _as_list(old), _as_list(new)
+    if len(new) < len(old):
+        raise _Unmergeable('removed components')
+    if not all(isinstance(x, dict) for x in old+new):
+        raise _Unmergeable('not a component')
+
+    delta = []
+    last = 0  # items after the last changed one are left out
+    for i, item in enumerate(new):
+        if i >= len(old):
+            delta.append(item)
+            last = i+1
+            continue
+
+        # items are kept in place, merging by index, id or name gives the same result then
+        old_item = old[i]
+        for k in ['id', 'name']:
+            if not _same(old_item.get(k), item.get(k)):
+                raise _Unmergeable('components reordered')
+
+        d = {}
+        for k in ['id', 'name']:
+            if k in item:
+                d[k] = item[k]
+        if not _same(old_item, item):
+            d.update(_dict_delta(old_item, item))
+            last = i+1
+        delta.append(d)
+    return delta[:last]
+
+
+def _dict_delta(old, new):
+    for k in old:
+        if k not in new:
+            raise _Unmergeable(k)
+
+    delta = {}
+    for k, v in new.items():
+        if k not in old:
+            delta[k] = v
+        else:
+            ov = old[k]
+            if _same(ov, v):
+                continue
+            if isinstance(ov, dict) and isinstance(v, dict):
+                delta[k] = _dict_delta(ov, v)
+            else:
+                delta[k] = v
+    return delta
+
+
+if __name__ == '__main__':
+    old = {'title': {'text': 'a'}, 'series': [{'name': 's1', 'data': [1, 2]}, {'name': 's2', 'data': [3]}]}
+    new = {'title': {'text': 'a'}, 'series': [{'name': 's1', 'data': [1, 2, 3]}, {'name': 's2', 'data': [3]}]}
+    print(option_delta(old, new))
+    print(option_delta(new, {'series': new['series']}))
@@ -1,7 +1,10 @@
+from array import array
 from raw_echarts.bases import *
 
 
 class AnimationMixin:
+    __slots__ = ()
+
     animation = RawOption(
         __doc__='True or False, whether enable chart animation.')
     animationThreshold = RawOption(
@@ -28,6 +31,8 @@ class Animation(AnimationMixin, Option):
 
 
 class PositionMixin:
+    __slots__ = ()
+
     x = RawOption()
     y = RawOption()
     left = RawOption()
@@ -39,12 +44,16 @@ class PositionMixin:
 
 
 class ColorMixin:
+    __slots__ = ()
+
     color = RawOption()
     colorAlpha = RawOption()
     colorSaturation = RawOption()
 
 
 class ShadowMixin:
+    __slots__ = ()
+
     color = RawOption()
     shadowColor = RawOption()
     shadowOffsetX = RawOption()
@@ -54,6 +63,8 @@ class ShadowMixin:
 
 
 class StyleMixin(ShadowMixin):
+    __slots__ = ()
+
     backgroundColor = RawOption()
     borderWidth = RawOption()
     borderColor = RawOption()
@@ -63,6 +74,8 @@ class StyleMixin(ShadowMixin):
 
 
 class SymbolMixin:
+    __slots__ = ()
+
     symbol = RawOption(value_choices=['circle', 'rect', 'roundRect', 'triangle',
                                       'diamond', 'pin', 'arrow', 'emptyCircle',
                                       'none'])
@@ -156,6 +169,8 @@ class Emphasis(Option):
 
 
 class SymbolMixin:
+    __slots__ = ()
+
     symbol = RawOption()
     symbolSize = RawOption()
     symbolRotate = RawOption()
@@ -271,11 +286,59 @@ class Encode(Option):
     itemName = RawOption()
 
 
+def column_array(values):
+    '''
+    compact copy of a dataset column: `array` of int64 or double if all values are numbers, else a list.
+    arrays, memoryviews and numpy arrays are used as is.
+    '''
+    if isinstance(values, (array, memoryview)) or (np is not None and isinstance(values, np.ndarray)):
+        return values
+    values = list(values)
+    types = set(map(type, values))
+    if types <= {int}:
+        try:
+            return array('q', values)
+        except OverflowError:
+            return values
+    if types <= {int, float}:
+        return array('d', values)
+    return values
+
+
 class DataSet(Option):
+    '''
+    data shared by series, which refer to it by `datasetIndex` and map its dimensions with `encode`.
+    '''
     source = RawOption()
     dimensions = RawOption([])
     sourceHeader = RawOption()
 
+    @classmethod
+    def from_columns(cls, columns, dimensions=None, **kw):
+        '''
+        dataset with column oriented source {dimension: values}, numeric columns are kept in arrays.
+        '''
+        source = dict((k, column_array(v)) for k, v in columns.items())
+        if dimensions is not None:
+            kw['dimensions'] = dimensions
+        return cls(source=source, **kw)
+
+    @classmethod
+    def from_rows(cls, rows, dimensions=None, **kw):
+        '''
+        dataset from rows like [[dim1, dim2, ...], [v1, v2, ...], ...], stored in columns.
+        the first row is the header if `dimensions` is not given.
+        '''
+        rows = iter(rows)
+        if dimensions is None:
+            dimensions = list(next(rows))
+        names = [d['name'] if isinstance(d, dict) else d for d in dimensions]
+        columns = [[] for x in names]
+        for row in rows:
+            for column, v in zip(columns, row):
+                column.append(v)
+        return cls.from_columns(dict(zip(names, columns)), dimensions=dimensions, **kw)
+
 
 class AriaSeperator(Option):
     middle = RawOption()
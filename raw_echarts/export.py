@@ -0,0 +1,88 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from raw_echarts.bases import CONFIG
+from raw_echarts.charts import Chart, html_path
+
+
+__all__ = ['export_files']
+
+
+def _init_worker(config):
+    # settings made in the main process are not there in spawned workers
+    for k, v in config.items():
+        CONFIG[k] = v
+
+
+def _render(chart, path, title, compact):
+    '''
+    render one chart in a worker, errors are returned to be reported with the path.
+    '''
+    try:
+        if not isinstance(chart, Chart):
+            chart = chart()
+        chart.render_file(path, title=title, compact=compact)
+    except Exception as e:
+        return e
+
+
+def export_files(jobs, workers=None, threads=False, title='Awesome Echarts', compact=None, pending=None):
+    '''
+    render charts to html files with `render_file` in a process pool, yield (path, error) in the order of jobs.
+    path is the file written, with .html added like `render_file` does, error is None if it's written.
+
+    jobs: iterable of (chart, path), chart is a Chart or a picklable function returning one,
+        which is called in the worker then, so charts are built in parallel too.
+    workers: size of the pool, default to cpu count, 0 to render in the current process.
+    threads: use a thread pool instead of processes, charts are not pickled then.
+    pending: max jobs submitted but not reported yet, `jobs` is consumed lazily so memory is bounded.
+    '''
+    if workers == 0:
+        for chart, path in jobs:
+            yield html_path(path), _render(chart, path, title, compact)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    pending = pending or workers*4
+    if threads:
+        executor = ThreadPoolExecutor(workers)
+    else:
+        executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(dict(CONFIG._data),))
+
+    futures = deque()
+    try:
+        for chart, path in jobs:
+            futures.append((path, executor.submit(_render, chart, path, title, compact)))
+            if len(futures) >= pending:
+                yield _result(*futures.popleft())
+        while futures:
+            yield _result(*futures.popleft())
+    finally:
+        for path, f in futures:
+            f.cancel()
+        executor.shutdown()
+
+
+def _result(path, future):
+    path = html_path(path)
+    try:
+        return path, future.result()
+    except Exception as e:  # e.g. the chart can't be pickled
+        return path, e
+
+
+if __name__ == '__main__':
+    import tempfile
+    from raw_echarts.charts import Bar
+
+    def bar_chart(i):
+        c = Chart()
+        c.xAxis(data=['a', 'b', 'c'])
+        c.yAxis.use()
+        c.add_chart(Bar(f'bar{i}', [i, i+1, i+2]))
+        return c
+
+    folder = tempfile.mkdtemp()
+    jobs = ((bar_chart(i), os.path.join(folder, f'chart{i}.html')) for i in range(20))
+    for path, error in export_files(jobs):
+        print(path, error)
@@ -0,0 +1,113 @@
+'''
+convert pandas DataFrame columns to series data, axis data or dataset source in bulk.
+values are kept in numpy arrays, which are written by the json writer without python lists.
+'''
+from raw_echarts.bases import np
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+__all__ = ['column_values', 'is_time_column', 'frame_column', 'frame_points', 'frame_columns']
+
+
+def _date_unit(values):
+    '''
+    the coarsest unit all datetime64[ms] values can be written in, the same for the whole column
+    '''
+    ms = values.astype('int64')
+    if not (ms % 1000).any():
+        if not (ms % 86400000).any():
+            return 'D'
+        return 's'
+    return 'ms'
+
+
+def column_values(col, dates='iso'):
+    '''
+    values of a pandas Series or Index as numpy array.
+    dates: datetimes are converted to ISO strings ('iso') or epoch milliseconds ('ms'), tz-aware ones in UTC.
+    missing numbers are kept as NaN in float arrays, which are written as null, other missing values become None.
+    '''
+    if pd is None:
+        raise ImportError('pandas is required to read DataFrame columns.')
+    if isinstance(col, pd.Index):
+        col = col.to_series()
+    missing = col.isna().to_numpy()
+    has_missing = missing.any()
+
+    if pd.api.types.is_datetime64_any_dtype(col):
+        if col.dt.tz is not None:
+            col = col.dt.tz_convert('UTC').dt.tz_localize(None)
+            timezone = 'UTC'
+        else:
+            timezone = 'naive'
+        values = col.to_numpy('datetime64[ms]')
+        if dates == 'ms':
+            values = values.astype('int64')
+        elif dates == 'iso':
+            values = np.datetime_as_string(values, unit=_date_unit(values[~missing]), timezone=timezone)
+        else:
+            raise ValueError(f'dates should be "iso" or "ms", not {dates!r}')
+    elif pd.api.types.is_bool_dtype(col) or not pd.api.types.is_numeric_dtype(col):
+        values = col.to_numpy(dtype=object)
+    elif has_missing:
+        values = col.to_numpy(dtype=float, na_value=np.nan)
+    else:
+        values = col.to_numpy()
+
+    if has_missing and values.dtype.kind != 'f':
+        values = values.astype(object)
+        values[missing] = None
+    return values
+
+
+def is_time_column(df, column=None):
+    '''
+    whether the column of `df` (the index if `column` is None) has datetimes
+    '''
+    if pd is None:
+        raise ImportError('pandas is required to read DataFrame columns.')
+    col = df.index if column is None else df[column]
+    return pd.api.types.is_datetime64_any_dtype(col)
+
+
+def frame_column(df, column=None, dates='iso'):
+    '''
+    values of a column of `df`, the index if `column` is None
+    '''
+    if column is None:
+        return column_values(df.index, dates)
+    return column_values(df[column], dates)
+
+
+def frame_points(df, x=None, y=None, dates='iso'):
+    '''
+    series data like [[x, y], ...] from columns `x` (the index if None) and `y` of `df`, as a 2-D array
+    '''
+    xs = frame_column(df, x, dates)
+    ys = frame_column(df, y, dates)
+    if xs.dtype.kind in 'iuf' and ys.dtype.kind in 'iuf':
+        return np.column_stack((xs, ys))
+    points = np.empty((len(xs), 2), dtype=object)
+    for i, values in enumerate((xs, ys)):
+        points[:, i] = values
+        if values.dtype.kind == 'f':  # NaN of numbers are missing values in object arrays too
+            points[np.isnan(values), i] = None
+    return points
+
+
+def frame_columns(df, columns=None, dates='iso'):
+    '''
+    {column name: values} of `df`, to be used as dataset source
+    '''
+    if columns is None:
+        columns = list(df.columns)
+    return dict((str(c), frame_column(df, c, dates)) for c in columns)
+
+
+if __name__ == '__main__':
+    df = pd.DataFrame({'t': pd.date_range('2020-01-01', periods=3), 'v': [1.5, None, 3], 'k': ['a', 'b', 'c']})
+    print(frame_column(df, 't'), frame_column(df, 't', 'ms'), frame_column(df, 'v'))
+    print(frame_points(df, 't', 'v', dates='ms'))
@@ -0,0 +1,118 @@
+from raw_echarts.charts import *
+
+
+__all__ = ['Page']
+
+
+# defined once in a page, every chart is created with it
+INIT_JS = ('function raw_echarts_init(id,option){'
+           'var chart=echarts.init(document.getElementById(id),"white",{"renderer":"canvas"});'
+           'chart.setOption(option);return chart;}')
+
+
+def asset_url(js):
+    '''
+    url of a js dependence, names without scheme are found in `CONFIG.ECHARTS_ASSETS`
+    '''
+    if js[:4] in ['http', 'file'] or js.startswith('//'):
+        return js
+    return CONFIG.ECHARTS_ASSETS.rstrip('/')+'/'+js.lstrip('/')
+
+
+class Page:
+    '''
+    render many charts into one html document.
+    js dependences (including map data) are loaded once, and charts are created by one shared init function.
+    connect: connect tooltip, dataZoom and other actions of all charts with `echarts.connect`.
+    '''
+
+    def __init__(self, *charts, title='Awesome Echarts', connect=False):
+        self.charts = []
+        self.title = title
+        self.connect = connect
+        self.add(*charts)
+
+    def __len__(self):
+        return len(self.charts)
+
+    def __iter__(self):
+        return iter(self.charts)
+
+    def add(self, *charts):
+        ids = {c.chart_id for c in self.charts}
+        for c in charts:
+            if c.chart_id in ids:
+                raise ValueError(f'chart id "{c.chart_id}" is used in the page already.')
+            ids.add(c.chart_id)
+            self.charts.append(c)
+        return self
+
+    @property
+    def js_dependences(self):
+        '''
+        urls of all js needed by the charts, in order without duplicates
+        '''
+        urls = [asset_url('echarts.min.js')]
+        for c in self.charts:
+            for js in c._js_dependences:
+                url = asset_url(js)
+                if url not in urls:
+                    urls.append(url)
+        return urls
+
+    def _chart_parts(self, chart, compact=False):
+        '''
+        html of a chart before and after its option json
+        '''
+        cid = chart.chart_id
+        div = '<div id="{}" class="chart-container" style="{}"></div>'.format(
+            escape_attr(cid), escape_attr(f'width:{chart.width};height:{chart.height};'))
+        sep = '' if compact else '\n'
+        return (f'{div}{sep}<script>var chart_{cid}=raw_echarts_init("{cid}",',
+                f');</script>{sep}')
+
+    def iter_html(self, title=None, compact=None, encoding=None):
+        '''
+        yield the html of `render_file` in chunks, option json of charts are encoded while iterating.
+        encoding: yield bytes in this encoding instead of str, e.g. for wsgi responses.
+        '''
+        if compact is None:
+            compact = bool(CONFIG.COMPACT_OUTPUT)
+        sep = '' if compact else '\n'
+        scripts = sep.join([f'<script type="text/javascript" src="{escape_attr(js)}"></script>'
+                            for js in self.js_dependences]+[f'<script>{INIT_JS}</script>'])
+        head, tail = html_parts(self.title if title is None else title, scripts, compact)
+        return encode_chunks(self._iter_body(head, tail, compact), encoding)
+
+    def _iter_body(self, head, tail, compact):
+        yield head
+        for c in self.charts:
+            before, after = self._chart_parts(c, compact)
+            yield before
+            yield from c._iter_json(compact)
+            yield after
+        if self.connect and len(self.charts) > 1:
+            charts = ','.join([f'chart_{c.chart_id}' for c in self.charts])
+            yield f'<script>echarts.connect([{charts}]);</script>'+('' if compact else '\n')
+        yield tail
+
+    def render_file(self, file=None, title=None, compact=None):
+        '''
+        return the html if `file` is None.
+        file: path or file like object to write the html to, which is written in chunks and not returned then.
+        '''
+        if file is None:
+            return ''.join(self.iter_html(title, compact))
+        write_html(file, lambda encoding: self.iter_html(title, compact, encoding))
+
+
+if __name__ == '__main__':
+    page = Page(title='page', connect=True)
+    for i in range(3):
+        c = Chart()
+        c.xAxis(data=['a', 'b', 'c'])
+        c.yAxis.use()
+        c.tooltip.use()
+        c.add_chart(Bar(f'bar{i}', [i, i+1, i+2]))
+        page.add(c)
+    print(page.render_file())
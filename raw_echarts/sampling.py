@@ -0,0 +1,208 @@
+'''
+downsample series data in python before it's written to json, so the browser gets only the points it can show:
+    - lttb: largest triangle three buckets, keeps the visual shape of lines.
+    - minmax: min and max of every bucket, keeps peaks and valleys.
+numpy is used if available, plain python otherwise.
+'''
+from raw_echarts.bases import *
+
+
+__all__ = ['Sampled', 'lttb_indices', 'minmax_indices', 'METHODS']
+
+
+def _lttb_python(x, y, threshold):
+    n = len(y)
+    edges = [1+i*(n-2)//(threshold-2) for i in range(threshold-1)]  # the last is n-1
+    indices = [0]
+    a = 0
+    for i in range(threshold-2):
+        start, end = edges[i], edges[i+1]
+        if i == threshold-3:
+            avg_x, avg_y = x[n-1], y[n-1]
+        else:
+            next_end = edges[i+2]
+            avg_x = sum(x[end:next_end])/(next_end-end)
+            avg_y = sum(y[end:next_end])/(next_end-end)
+        ax, ay = x[a], y[a]
+        best, best_area = start, -1
+        for j in range(start, end):
+            area = abs((ax-avg_x)*(y[j]-ay)-(ax-x[j])*(avg_y-ay))
+            if area > best_area:
+                best, best_area = j, area
+        a = best
+        indices.append(a)
+    indices.append(n-1)
+    return indices
+
+
+def _lttb_numpy(x, y, threshold):
+    n = len(y)
+    edges = 1+np.arange(threshold-1)*(n-2)//(threshold-2)  # same buckets as _lttb_python
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0], indices[-1] = 0, n-1
+    a = 0
+    for i in range(threshold-2):
+        start, end = edges[i], edges[i+1]
+        if i == threshold-3:
+            avg_x, avg_y = x[n-1], y[n-1]
+        else:
+            next_end = edges[i+2]
+            avg_x = x[end:next_end].mean()
+            avg_y = y[end:next_end].mean()
+        ax, ay = x[a], y[a]
+        areas = np.abs((ax-avg_x)*(y[start:end]-ay)-(ax-x[start:end])*(avg_y-ay))
+        a = start+int(areas.argmax())
+        indices[i+1] = a
+    return indices
+
+
+def lttb_indices(x, y, threshold):
+    '''
+    indices of at most `threshold` points chosen by largest triangle three buckets, x should be ascending.
+    '''
+    n = len(y)
+    if threshold >= n:
+        return list(range(n))
+    if threshold < 3:
+        return [0, n-1]
+    if np is not None:
+        return _lttb_numpy(np.asarray(x, dtype=float), np.asarray(y, dtype=float), threshold)
+    return _lttb_python(x, y, threshold)
+
+
+def minmax_indices(y, threshold):
+    '''
+    indices of the first, the last, and the min and max points of every bucket in order, at most `threshold` points.
+    '''
+    n = len(y)
+    buckets = (threshold-2)//2
+    if threshold >= n:
+        return list(range(n))
+    if buckets < 1:
+        return [0, n-1]
+    size = -(-n//buckets)
+
+    if np is not None:
+        y = np.asarray(y, dtype=float)
+        padded = np.full(buckets*size, np.nan)
+        padded[:n] = y
+        padded = padded.reshape(buckets, size)
+        valid = ~np.isnan(padded).all(axis=1)
+        padded = padded[valid]
+        offsets = np.arange(buckets)[valid]*size
+        lows = np.nanargmin(padded, axis=1)+offsets
+        highs = np.nanargmax(padded, axis=1)+offsets
+        return np.unique(np.concatenate(([0, n-1], lows, highs)))
+
+    indices = {0, n-1}
+    for start in range(0, n, size):
+        bucket = range(start, min(start+size, n))
+        indices.add(min(bucket, key=y.__getitem__))
+        indices.add(max(bucket, key=y.__getitem__))
+    return sorted(indices)
+
+
+METHODS = ['lttb', 'minmax']
+
+
+class Sampled(LazyValue):
+    '''
+    series data that is downsampled to at most `threshold` points when written, the full data is kept.
+    data: values like [y, ...], which are written as [[index, y], ...] to keep their positions (also when
+        they are not more than `threshold`), or points like [[x, y, ...], ...], lists or numpy arrays.
+        missing values are dropped.
+    '''
+
+    def __init__(self, data, threshold, method='lttb'):
+        if method not in METHODS:
+            raise ValueError(f'sampling method should be one of {METHODS}, not {method!r}')
+        if threshold < 2:
+            raise ValueError('at least 2 points should be kept to draw a line.')
+        self.data = data
+        self.threshold = threshold
+        self.method = method
+
+    def __repr__(self):
+        return 'Sampled({}, {}, {!r})'.format(len(self.data), self.threshold, self.method)
+
+    def __len__(self):
+        return min(len(self.data), self.threshold)
+
+    def value(self):
+        data = self.data
+        if len(data) <= self.threshold:  # same shape as sampled data
+            if _is_points(data):
+                return data
+            if isinstance(data, array) or np is not None and isinstance(data, np.ndarray):
+                data = data.tolist()
+            return [[i, v] for i, v in enumerate(data) if _number(v) is not None]
+        if np is not None:
+            return self._sample_numpy(data)
+        return self._sample_python(data)
+
+    def _indices(self, x, y):
+        if self.method == 'minmax':
+            return minmax_indices(y, self.threshold)
+        return lttb_indices(x, y, self.threshold)
+
+    def _sample_numpy(self, data):
+        a = np.asarray(data)
+        if a.ndim == 1:
+            y = _as_floats(a)
+            keep = np.flatnonzero(~np.isnan(y))
+            indices = keep[self._indices(keep, y[keep])]
+            return [[i, v] for i, v in zip(indices.tolist(), a[indices].tolist())]  # keep indices int
+
+        y = _as_floats(a[:, 1])
+        keep = np.flatnonzero(~np.isnan(y))
+        x = _as_floats(a[:, 0])
+        if np.isnan(x[keep]).any():  # e.g. category names or dates, points are taken as evenly spaced
+            x = keep
+        else:
+            x = x[keep]
+        indices = keep[self._indices(x, y[keep])]
+        if isinstance(data, np.ndarray):
+            return data[indices]
+        return [data[i] for i in indices]
+
+    def _sample_python(self, data):
+        points = isinstance(data[0], (list, tuple))
+        keep = [i for i, v in enumerate(data) if _number(v[1] if points else v) is not None]
+        y = [_number(data[i][1] if points else data[i]) for i in keep]
+        x = keep
+        if points:
+            xs = [_number(data[i][0]) for i in keep]
+            if None not in xs:
+                x = xs
+        indices = [keep[i] for i in self._indices(x, y)]
+        if points:
+            return [data[i] for i in indices]
+        return [[i, data[i]] for i in indices]
+
+
+def _is_points(data):
+    if np is not None and isinstance(data, np.ndarray):
+        return data.ndim > 1
+    return len(data) > 0 and isinstance(data[0], (list, tuple))
+
+
+def _number(v):
+    if isinstance(v, (int, float)) and not isinstance(v, bool) and v == v:
+        return v
+    return None
+
+
+def _as_floats(a):
+    '''
+    float values of a numpy column, nan for those not numbers
+    '''
+    if a.dtype.kind in 'iuf':
+        return a.astype(float)
+    return np.array([_number(v) for v in a.tolist()], dtype=float)
+
+
+if __name__ == '__main__':
+    import math
+    data = [math.sin(i/100) for i in range(10000)]
+    print(Sampled(data, 10).value())
+    print(Sampled([[i, v] for i, v in enumerate(data)], 10, 'minmax').value())
@@ -0,0 +1,553 @@
+from datetime import date, time, datetime
+from array import array
+from decimal import Decimal
+from math import isfinite
+from simplejson.encoder import encode_basestring_ascii, encode_basestring
+from raw_echarts.bases import *
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+__all__ = ['dump', 'dumps', 'JsonWriter', 'float_format', 'parse_precision', 'PrecisionMixin', 'ROUNDED_KEYS']
+
+
+# hand pieces over to the sink after so many of them
+CHUNK_PIECES = 8192
+# numbers of a flat list are joined in slices of this size, so a huge series doesn't make a huge chunk
+CHUNK_ITEMS = 65536
+
+_NUMBER_TYPES = frozenset([int, float])
+_INT_TYPES = frozenset([int])
+_FLOAT_TYPES = frozenset([float])
+# typecodes of `array` and formats of `memoryview` written as numbers
+_ARRAY_CODES = frozenset('bBhHiIlLqQfd')
+_LIST_TYPES = frozenset([list])
+
+# owner of the object passed to `JsonWriter.write`
+_TOP = object()
+
+# values under these keys are written with the precision in effect: data of series, dataset source,
+# coord/value of mark points etc, and axis bounds
+ROUNDED_KEYS = frozenset(['data', 'source', 'coord', 'value', 'min', 'max'])
+
+
+def _float_str(o):
+    if not isfinite(o):
+        raise ValueError('Out of range float values are not JSON compliant: {!r}'.format(o))
+    return float.__repr__(o)
+
+
+def _number_str(o):
+    if type(o) is float:
+        return _float_str(o)
+    return int.__repr__(o)
+
+
+def float_format(precision):
+    '''
+    function formatting finite floats to json by `precision`:
+    None for full repr, int for significant digits, ('f', n) for n fixed decimals.
+    '''
+    if precision is None:
+        return float.__repr__
+    if isinstance(precision, int):
+        return '%.{}g'.format(precision).__mod__
+    kind, n = precision
+    if kind != 'f':
+        raise ValueError(f'precision should be digits or ("f", decimals), not {precision!r}')
+    return lambda o: float.__repr__(round(o, n))
+
+
+def _checked_format(fmt):
+    def format_float(o):
+        if not isfinite(o):
+            raise ValueError('Out of range float values are not JSON compliant: {!r}'.format(o))
+        return fmt(o)
+    return format_float
+
+
+def parse_precision(digits=None, decimals=None):
+    '''
+    precision taken by `float_format` from `digits` significant digits or `decimals` fixed decimals
+    '''
+    if digits is not None and decimals is not None:
+        raise ValueError('only one of digits and decimals can be given.')
+    if digits is not None:
+        if digits < 1:
+            raise ValueError('digits should be at least 1.')
+        return int(digits)
+    if decimals is not None:
+        return ('f', int(decimals))
+    return None
+
+
+def _join_numbers(l, types, separator, fmt=float.__repr__):
+    '''
+    join a flat list of int/float, `types` are the types of items, floats are formatted by `fmt`
+    '''
+    if float in types and not all(map(isfinite, l)):
+        raise ValueError('Out of range float values are not JSON compliant')
+    if fmt is float.__repr__ or float not in types:
+        return separator.join(map(repr, l))
+    if int in types:
+        return separator.join([fmt(x) if type(x) is float else repr(x) for x in l])
+    return separator.join(map(fmt, l))
+
+
+def _null_str(o):
+    return 'null'
+
+
+def _bool_str(o):
+    return 'true' if o else 'false'
+
+
+class PrecisionMixin:
+    '''
+    options written with their own float precision, see `set_precision`.
+    subclasses declare the `_precision` slot.
+    '''
+    __slots__ = ()
+
+    def set_precision(self, digits=None, decimals=None):
+        '''
+        write floats in `data`, `coord`, `value` etc (see `ROUNDED_KEYS`) below this option
+        with `digits` significant digits or `decimals` fixed decimals, stored data is not changed.
+        both None to follow the chart.
+        '''
+        self._before_write()  # cached json has the former precision
+        self._precision = parse_precision(digits, decimals)
+        return self
+
+
+class JsonWriter:
+    '''
+    write option tree to json directly, without building a plain dict copy first.
+    output is the same as `dumps(chart.get_option())`: JsCode without quotes, Image as url, date/time in isoformat.
+    `iterencode` yields the json in chunks, `write` passes them to the `write` callback.
+
+    precision: float precision of values under `ROUNDED_KEYS`, see `float_format`.
+        options with `PrecisionMixin` (e.g. series) may have their own.
+
+    with `cache`, json of every option is kept in its `_json` and reused until the option or its children change.
+    options found in raw values (e.g. series name in legend data) are not tracked,
+    so the options containing them are always encoded again.
+    a cached fragment is held back until it's done, use `cache='read'` to reuse cached json without keeping new one,
+    then nothing is held back from the sink.
+    '''
+
+    def __init__(self, write=None, indent=4, sort_keys=False, ensure_ascii=True, separators=None, cache=False,
+                 precision=None):
+        self._write = write
+        self._pieces = []
+        self._capturing = 0  # pieces of cached fragments are kept until the fragment is done
+        self._foreign = False  # untracked option found in the current fragment
+        self.cache = cache
+        self.indent = ' '*indent if isinstance(indent, int) else indent
+        self.sort_keys = sort_keys
+        self.encode_str = encode_basestring_ascii if ensure_ascii else encode_basestring
+        if separators:
+            self.item_separator, self.key_separator = separators
+        elif self.indent is None:
+            self.item_separator, self.key_separator = ', ', ': '
+        else:
+            self.item_separator, self.key_separator = ',', ': '
+        self._settings = (self.indent, self.item_separator, self.key_separator, ensure_ascii, sort_keys)
+        # scalars in containers are put directly, without another generator
+        self._scalars = {str: self.encode_str, int: int.__repr__, float: _float_str, type(None): _null_str,
+                         bool: _bool_str}
+        float_format(precision)  # check it early
+        self._precision = precision  # in effect for the current option
+        self._fmt = float.__repr__  # of floats being written, a rounding one under `ROUNDED_KEYS`
+
+    def write(self, obj):
+        for chunk in self.iterencode(obj):
+            self._write(chunk)
+
+    def iterencode(self, obj):
+        '''
+        yield json of `obj` in chunks
+        '''
+        self._pieces = []
+        yield from self._encode(obj, 0, _TOP)
+        if self._pieces:
+            yield self._take()
+
+    def _take(self):
+        chunk = ''.join(self._pieces)
+        self._pieces = []
+        return chunk
+
+    def _full(self):
+        return len(self._pieces) >= CHUNK_PIECES and not self._capturing
+
+    def _put(self, s):
+        self._pieces.append(s)
+
+    def _encode(self, o, level, owner=None):
+        '''
+        generator yielding chunks ready for the sink.
+        owner: the option whose `_data` contains `o`
+        '''
+        if isinstance(o, str):
+            self._put(self.encode_str(o))
+        elif o is None:
+            self._put('null')
+        elif o is True:
+            self._put('true')
+        elif o is False:
+            self._put('false')
+        elif isinstance(o, int):
+            self._put(int.__repr__(o))
+        elif isinstance(o, float):
+            self._put(self._scalars[float](o))
+        elif isinstance(o, OptionBase):
+            yield from self._encode_option(o, level, owner)
+        elif isinstance(o, (dict, ODD)):
+            yield from self._encode_dict(o, level)
+        elif isinstance(o, list):
+            yield from self._encode_list(o, level)
+        elif isinstance(o, (array, memoryview)):
+            yield from self._encode_array(o, level)
+        elif np is not None and isinstance(o, np.ndarray):
+            yield from self._encode_ndarray(o, level)
+        elif np is not None and isinstance(o, np.generic):
+            yield from self._encode(o.item(), level)
+        elif isinstance(o, LazyValue):
+            yield from self._encode(o.value(), level)
+        elif isinstance(o, JsCode):
+            self._put(o.js)
+        elif isinstance(o, Image):
+            self._put(self.encode_str(o.url or o.uri))
+        elif isinstance(o, (date, time, datetime)):
+            self._put(self.encode_str(o.isoformat()))
+        elif isinstance(o, Empty):
+            self._put('null')
+        elif isinstance(o, Decimal):
+            self._put(str(o))
+        elif callable(getattr(o, '_asdict', None)):
+            yield from self._encode_dict(o._asdict(), level)
+        elif isinstance(o, tuple):
+            yield from self._encode_list(o, level)
+        else:
+            raise TypeError('Object of type {} is not JSON serializable'.format(o.__class__.__name__))
+
+    def _encode_option(self, o, level, owner):
+        if isinstance(o, PrecisionMixin) and o._precision is not None and o._precision != self._precision:
+            return self._encode_option_precision(o, level, owner)
+        return self._encode_option_json(o, level, owner)
+
+    def _encode_option_precision(self, o, level, owner):
+        '''
+        option with its own precision
+        '''
+        saved = self._precision
+        self._precision = o._precision
+        if self._fmt is not float.__repr__:  # e.g. series found in data
+            self._set_format(float_format(o._precision))
+        yield from self._encode_option_json(o, level, owner)
+        self._precision = saved
+        if self._fmt is not float.__repr__:
+            self._set_format(float_format(saved))
+
+    def _encode_option_json(self, o, level, owner):
+        if owner is not _TOP and (owner is None or (o._parent is not owner and o._holder is not owner)):
+            # not a child, changes of it don't reach the options above
+            foreign = True
+        else:
+            foreign = False
+
+        if not self.cache:
+            yield from self._encode_data(o, level)
+            self._foreign = self._foreign or foreign
+            return
+
+        key = (self._settings, 0 if self.indent is None else level, self._precision, self._fmt is float.__repr__)
+        if o._json is not None:
+            fragment = o._json.get(key)
+            if fragment is not None:
+                self._put(fragment)
+                self._foreign = self._foreign or foreign
+                return
+
+        if self.cache == 'read':
+            yield from self._encode_data(o, level)
+            self._foreign = self._foreign or foreign
+            return
+
+        saved = self._foreign
+        self._foreign = False
+        self._capturing += 1
+        start = len(self._pieces)
+        yield from self._encode_data(o, level)
+        self._capturing -= 1
+
+        if not self._foreign:
+            fragment = ''.join(self._pieces[start:])
+            self._pieces[start:] = [fragment]
+            if o._json is None:
+                o._json = {}
+            o._json[key] = fragment
+        self._foreign = saved or self._foreign or foreign
+        if self._full():
+            yield self._take()
+
+    def _encode_data(self, o, level):
+        owner = o._src or o  # children of a clone are still those of the original
+        if isinstance(o, RawOption):
+            return self._encode(o._data, level)
+        elif o._as_array and isinstance(o._data, ODD):
+            return self._encode_list(o._data.value_list, level, owner)
+        elif isinstance(o._data, ODD):
+            return self._encode_dict(o._data, level, owner)
+        else:
+            return self._encode(o._data, level)
+
+    def _set_format(self, fmt):
+        self._fmt = fmt
+        if fmt is float.__repr__:
+            self._scalars[float] = _float_str
+        else:
+            self._scalars[float] = _checked_format(fmt)
+
+    def _encode_rounded(self, o, level, owner):
+        '''
+        value under one of `ROUNDED_KEYS`, floats in it are written with the precision in effect
+        '''
+        self._set_format(float_format(self._precision))
+        yield from self._encode(o, level, owner)
+        self._set_format(float.__repr__)
+
+    def _newline(self, level):
+        return '\n'+self.indent*level
+
+    def _encode_numbers(self, l, types, level):
+        '''
+        flat list or array of numbers, `types` are the types of items
+        '''
+        if not l:
+            self._put('[]')
+            return
+
+        if self.indent is None:
+            inner = outer = ''
+        else:
+            inner = self._newline(level+1)
+            outer = self._newline(level)
+        separator = self.item_separator+inner
+
+        if len(l) <= CHUNK_ITEMS:
+            self._put('['+inner+_join_numbers(l, types, separator, self._fmt)+outer+']')
+            return
+        self._put('['+inner)
+        for i in range(0, len(l), CHUNK_ITEMS):
+            if i:
+                self._put(separator)
+            self._put(_join_numbers(l[i:i+CHUNK_ITEMS], types, separator, self._fmt))
+            if not self._capturing:
+                yield self._take()
+        self._put(outer+']')
+
+    def _encode_array(self, o, level):
+        code = o.typecode if isinstance(o, array) else o.format
+        if code not in _ARRAY_CODES or (isinstance(o, memoryview) and o.ndim != 1):
+            return self._encode_list(o.tolist(), level)
+        return self._encode_numbers(o, _FLOAT_TYPES if code in 'fd' else _INT_TYPES, level)
+
+    def _encode_ndarray(self, a, level):
+        '''
+        numbers of 1-D and 2-D arrays are formatted by chunks, same as the lists from `a.tolist()`, NaN as null
+        '''
+        kind = a.dtype.kind
+        if kind not in 'iuf' or a.ndim not in (1, 2) or (a.ndim == 2 and not a.shape[1]):
+            yield from self._encode(a.tolist(), level)
+            return
+        if not len(a):
+            self._put('[]')
+            return
+
+        if self.indent is None:
+            inner = outer = item_inner = item_outer = ''
+        else:
+            inner = self._newline(level+1)
+            outer = self._newline(level)
+            item_inner = self._newline(level+2)
+            item_outer = inner
+        separator = self.item_separator+inner
+
+        if a.ndim == 2:
+            width = a.shape[1]
+            item_separator = self.item_separator+item_inner
+            row_separator = item_outer+']'+separator+'['+item_inner
+            step = max(1, CHUNK_ITEMS//width)
+        else:
+            step = CHUNK_ITEMS
+
+        self._put('['+inner)
+        for i in range(0, len(a), step):
+            chunk = a[i:i+step]
+            if kind != 'f':
+                numbers = map(repr, chunk.ravel().tolist())
+            else:
+                if self._fmt is not float.__repr__ and isinstance(self._precision, tuple):  # fixed decimals
+                    chunk = chunk.astype(float)  # float32 values rounded in float32 are not exact
+                    with np.errstate(over='ignore'):
+                        rounded = np.round(chunk, self._precision[1])
+                    # values near the float max overflow when rounded, they have no decimals anyway
+                    chunk, fmt = np.where(np.isfinite(rounded), rounded, chunk), repr
+                else:
+                    fmt = self._fmt
+                values = chunk.ravel().tolist()
+                if np.isfinite(chunk).all():
+                    numbers = map(fmt, values)
+                elif np.isinf(chunk).any():
+                    raise ValueError('Out of range float values are not JSON compliant')
+                else:  # NaN are missing values, e.g. from DataFrame columns
+                    numbers = iter([fmt(v) if v == v else 'null' for v in values])
+            if i:
+                self._put(separator)
+            if a.ndim == 1:
+                self._put(separator.join(numbers))
+            else:
+                rows = map(item_separator.join, zip(*[numbers]*width))
+                self._put('['+item_inner+row_separator.join(rows)+item_outer+']')
+            if len(a) > step and not self._capturing:
+                yield self._take()
+        self._put(outer+']')
+
+    def _encode_list(self, l, level, owner=None):
+        if not l:
+            self._put('[]')
+            return
+
+        if self.indent is None:
+            inner = outer = ''
+        else:
+            inner = self._newline(level+1)
+            outer = self._newline(level)
+        separator = self.item_separator+inner
+
+        # most series data, join numbers at once
+        types = set(map(type, l))
+        if types <= _NUMBER_TYPES:
+            yield from self._encode_numbers(l, types, level)
+            return
+
+        # data of points, e.g. [[x, y], ...]
+        if types == _LIST_TYPES:
+            if self.indent is None:
+                item_inner = item_outer = ''
+            else:
+                item_inner = self._newline(level+2)
+                item_outer = inner
+            item_separator = self.item_separator+item_inner
+        else:
+            item_separator = None
+
+        scalars = self._scalars
+        self._put('['+inner)
+        first = True
+        for x in l:
+            if first:
+                first = False
+            else:
+                self._put(separator)
+            if item_separator is not None and x:
+                item_types = set(map(type, x))
+                if item_types <= _NUMBER_TYPES:
+                    self._put('['+item_inner+_join_numbers(x, item_types, item_separator, self._fmt)+item_outer+']')
+                    if self._full():
+                        yield self._take()
+                    continue
+            f = scalars.get(type(x))
+            if f is None:
+                yield from self._encode(x, level+1, owner)
+            else:
+                self._put(f(x))
+            if self._full():
+                yield self._take()
+        self._put(outer+']')
+
+    def _key_str(self, k):
+        if isinstance(k, RawOption):  # e.g. series name used as key
+            self._foreign = True
+            k = k._data
+        if isinstance(k, str):
+            return k
+        if k is True:
+            return 'true'
+        if k is False:
+            return 'false'
+        if k is None:
+            return 'null'
+        if isinstance(k, (int, float)):
+            return _number_str(k)
+        raise TypeError('keys must be str, int, float, bool or None, not {}'.format(k.__class__.__name__))
+
+    def _encode_dict(self, d, level, owner=None):
+        items = [(v._get_data_key() if isinstance(v, OptionBase) else self._key_str(k), v) for k, v in d.items()]
+        if not items:
+            self._put('{}')
+            return
+        if self.sort_keys:
+            items.sort(key=lambda x: x[0])
+
+        if self.indent is None:
+            inner = outer = ''
+        else:
+            inner = self._newline(level+1)
+            outer = self._newline(level)
+        separator = self.item_separator+inner
+
+        scalars = self._scalars
+        self._put('{'+inner)
+        first = True
+        for k, v in items:
+            if first:
+                first = False
+            else:
+                self._put(separator)
+            self._put(self.encode_str(k)+self.key_separator)
+            if k in ROUNDED_KEYS and self._precision is not None and self._fmt is float.__repr__:
+                yield from self._encode_rounded(v, level+1, owner)
+                if self._full():
+                    yield self._take()
+                continue
+            f = scalars.get(type(v))
+            if f is None:
+                yield from self._encode(v, level+1, owner)
+            else:
+                self._put(f(v))
+            if self._full():
+                yield self._take()
+        self._put(outer+'}')
+
+
+def dump(obj, fp, indent=4, sort_keys=False, ensure_ascii=True, separators=None, cache=False, precision=None):
+    '''
+    write an option object to file like `fp` in json chunks
+    '''
+    JsonWriter(fp.write, indent=indent, sort_keys=sort_keys, ensure_ascii=ensure_ascii,
+               separators=separators, cache=cache, precision=precision).write(obj)
+
+
+def dumps(obj, indent=4, sort_keys=False, ensure_ascii=True, separators=None, cache=False, precision=None):
+    '''
+    dump an option object to json, same as `bases.dumps` but walks the option tree directly
+    '''
+    chunks = []
+    JsonWriter(chunks.append, indent=indent, sort_keys=sort_keys, ensure_ascii=ensure_ascii,
+               separators=separators, cache=cache, precision=precision).write(obj)
+    return ''.join(chunks)
+
+
+if __name__ == '__main__':
+    import io
+    o = Option(title={'text': 'a'}, data=[1, 2.5, None], when=date(2020, 1, 1),
+               formatter=JsCode('function(p){return p;}'))
+    print(dumps(o))
+    buf = io.StringIO()
+    dump(o, buf, indent=None)
+    print(buf.getvalue())
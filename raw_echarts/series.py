@@ -1,9 +1,16 @@
 from raw_echarts.elements import *
 from raw_echarts.mapdata import *
 from raw_echarts.axis import *
+from raw_echarts.frames import frame_column, frame_points
+from raw_echarts.sampling import Sampled
+from raw_echarts.binary import PackedData, PackDataMixin
+from raw_echarts.serializer import PrecisionMixin
+from raw_echarts.streaming import extend_data
 
 
-class Series(Option):
+class Series(PackDataMixin, PrecisionMixin, Option):
+    __slots__ = ('_js_dependences', '_precision', '_tuned')
+
     type = RawOption()
     name = RawOption()
     label = Label(position='top')
@@ -19,6 +26,8 @@ class Series(Option):
 
     legendHoverLink = RawOption()
     hoverAnimation = Animation()
+    animation = RawOption()
+    animationThreshold = RawOption()
 
     coordinateSystem = RawOption(value_choices=['cartesian2d', 'polar'])
     xAxisIndex = RawOption()
@@ -41,15 +50,86 @@ class Series(Option):
 
     emphasis = Emphasis()
 
-    def __init__(self, type=None, name=None, data=[], **kw):
+    def __init__(self, type=None, name=None, data=None, **kw):
+        if data is None:
+            data = []  # a new list for each series, data is appended in place
         super().__init__(type=type, name=name, data=data, **kw)
         self._js_dependences = ['echarts.min.js']
+        self._precision = None
+        self._tuned = {}  # options filled by `tuning.tune_series`
 
     def add_js_link(self, js_link):
         if js_link not in self._js_dependences:
             self._js_dependences.append(js_link)
         return self
 
+    @classmethod
+    def from_frame(cls, df, y, x=None, name=None, dates='iso', **kw):
+        '''
+        series with data from pandas DataFrame `df`, extracted by columns without python loops.
+        y: column of values.
+        x: column paired with values as [[x, y], ...], the index if it's True, None for values only.
+        dates: datetimes are converted to ISO strings ('iso') or epoch milliseconds ('ms').
+        '''
+        if x is None:
+            data = frame_column(df, y, dates)
+        else:
+            data = frame_points(df, None if x is True else x, y, dates)
+        return cls(name=str(y) if name is None else name, data=data, **kw)
+
+    def use_dataset(self, datasetIndex=0, encode=None, seriesLayoutBy=None):
+        '''
+        take data from the dataset at `datasetIndex` instead of own `data`.
+        encode: map dimensions of the dataset to axes etc, e.g. {'x': 'year', 'y': 'sales'}
+        '''
+        self.data.unuse()
+        kw = {'datasetIndex': datasetIndex}
+        if encode is not None:
+            kw['encode'] = encode
+        if seriesLayoutBy is not None:
+            kw['seriesLayoutBy'] = seriesLayoutBy
+        self.opts(kw)
+        return self
+
+    def append_data(self, chunk):
+        '''
+        append points of `chunk` to data, see `Chart.append_data` to send them to the rendered chart too.
+        data is extended in place unless it's shared with clones, also the data in sampled or packed data.
+        '''
+        node = self.data
+        data = node._own_data() if node._used else None
+        wrapper = None
+        while isinstance(data, (PackedData, Sampled)):
+            wrapper, data = data, data.data
+        new = extend_data(data, chunk)
+        if new is None:
+            raise TypeError('data of {} can not be appended to.'.format(type(data).__name__))
+        if wrapper is not None:
+            wrapper.data = new
+        elif new is not node._data:
+            node.set(new)
+        return self
+
+    def downsample(self, threshold, method='lttb'):
+        '''
+        write at most `threshold` points of data, chosen in python when the chart is rendered.
+        unlike `sampling` of Line, the browser never gets the full data.
+        method: 'lttb' (largest triangle three buckets) or 'minmax' (min and max of every bucket).
+        series taking data from a dataset (see `use_dataset`) can't be downsampled, data would override the dataset.
+        '''
+        if not self.data._used:
+            raise ValueError('series {!r} has no data of its own to downsample, it may use a dataset.'.format(self.name._data))
+        data = packed = self.data._own_data()  # the data is kept, not shared with clones
+        if isinstance(data, PackedData):  # sampled first, then packed
+            data = data.data
+        if isinstance(data, Sampled):
+            data = data.data
+        data = Sampled(data, threshold, method)
+        if isinstance(packed, PackedData):
+            data = PackedData(data, packed.dtype)
+        self.data.set(data)
+        return self
+
 
 Series.delegate('hoverAnimation', prefix='hover2')
 
@@ -90,7 +170,7 @@ class Bar(Series):
     showBackground = RawOption()
     backgroundStyle = BarBackgroundStyle()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('bar', name, data, **kw)
 
 
@@ -135,9 +215,9 @@ class Pie(PositionMixin, AnimationMixin, Series):
     labelLine = LabelLine()
     lineStyle = Delegator('labelLine', 'lineStyle')
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         new_data = _parse_data_pair(
-            data, ['name', 'value', 'selected', 'label', 'labelLine', 'emphasis'])
+            [] if data is None else data, ['name', 'value', 'selected', 'label', 'labelLine', 'emphasis'])
         super().__init__('pie', name, new_data, **kw)
 
 
@@ -154,8 +234,8 @@ class Map(Series):
     nameProperty = RawOption()
     selectedMode = RawOption()
 
-    def __init__(self, mapType='china', name='', data=[], **kw):
-        new_data = _parse_data_pair(data, columns=['name', 'value', 'label'])
+    def __init__(self, mapType='china', name='', data=None, **kw):
+        new_data = _parse_data_pair([] if data is None else data, columns=['name', 'value', 'label'])
         super().__init__('map', name, new_data, mapType=mapType, **kw)
         MAPS.load_data()
         self.add_js_link(MAPS[mapType])
@@ -172,7 +252,7 @@ class Line(SymbolMixin, Series):
     lineStyle = LineStyle()
     areaStyle = AreaStyle()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('line', name, data, **kw)
 
 
@@ -181,7 +261,7 @@ class ScatterData(SymbolMixin, Option):  # todo: a common series data class
 
 
 class Scatter(SymbolMixin, Series):
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('scatter', name, data, **kw)
 
 
@@ -197,14 +277,14 @@ class EffectScatter(SymbolMixin, Series):
     showEffectOn = RawOption(value_choices=['render', 'emphasis'])
     rippleEffect = RippleEffect()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('effectScatter', name, data, **kw)
 
 
 class Radar(SymbolMixin, Series):
     radarIndex = RawOption()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('radar', name, data, **kw)
 
 
@@ -230,7 +310,7 @@ class Tree(SymbolMixin, PositionMixin, Series):
 
     leaves = Option(label=Label(), emphasis=Emphasis())
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('tree', name, data, **kw)
 
 
@@ -269,7 +349,7 @@ class TreeMap(SymbolMixin, PositionMixin, Series):
     label = Label()
     upperLabel = Label()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('treemap', name, data, **kw)
 
 
@@ -290,7 +370,7 @@ class Sunburst(AnimationMixin, Series):
     downplay = SunburstDownplay()
     levels = RawOption()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('sunburst', name, data, **kw)
 
 
@@ -298,7 +378,7 @@ class Boxplot(AnimationMixin, Series):
     layout = RawOption(value_choices=['vertical', 'horizontal'])
     boxWidth = RawOption()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('boxplot', name, data, **kw)
 
 
@@ -308,7 +388,7 @@ class CandleStick(AnimationMixin, Series):
     barMinWidth = RawOption()
     barMaxWidth = RawOption()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('candlestick', name, data, **kw)
 
 
@@ -322,14 +402,14 @@ class HeatMap(AnimationMixin, Series):
     minOpacity = RawOption()
     maxOpacity = RawOption()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('heatmap', name, data, **kw)
 
 
 class Parallel(AnimationMixin, Series):
     parallelIndex = RawOption()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('parallel', name, data, **kw)
 
 
@@ -346,7 +426,7 @@ class Lines(AnimationMixin, SymbolMixin, Series):
     polyline = RawOption()
     effect = LinesEffect()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('lines', name, data, **kw)
 
 
@@ -386,7 +466,7 @@ class Graph(AnimationMixin, SymbolMixin, Series):
     force = GraphForce()
     draggable = RawOption()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('graph', name, data, **kw)
 
 
@@ -400,7 +480,7 @@ class Sankey(PositionMixin, SymbolMixin, Series):
     focusNodeAdjacency = RawOption()
     levels = RawOption()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('sankey', name, data, **kw)
 
 
@@ -413,7 +493,7 @@ class Funnel(PositionMixin, SymbolMixin, Series):
     gap = RawOption()
     funnelAlign = RawOption(value_choices=['left', 'right', 'center'])
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('funnel', name, data, **kw)
 
 
@@ -441,7 +521,7 @@ class Gauge(PositionMixin, SymbolMixin, Series):
     title = Label()
     detail = Label()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('gauge', name, data, **kw)
 
 
@@ -452,21 +532,21 @@ class PictorialBar(AnimationMixin, SymbolMixin, Bar):
     symbolBoundingData = RawOption()
     symbolPatternSize = RawOption()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('pictorialbar', name, data, **kw)
 
 
 class ThemeRiver(PositionMixin, Series):
     singleAxisIndex = RawOption()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('themeRiver', name, data, **kw)
 
 
 class Custom(Series):
     renderItem = RawOption()
 
-    def __init__(self, name='', data=[], renderItem=None):
+    def __init__(self, name='', data=None, renderItem=None):
         if isins(renderItem, str):
             renderItem = JsCode(renderItem)
         super().__init__('custom', name, data, renderItem=renderItem)
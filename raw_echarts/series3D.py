@@ -1,9 +1,13 @@
 from raw_echarts.elements import *
 from raw_echarts.mapdata import *
 from raw_echarts.axis3D import *
+from raw_echarts.binary import PackDataMixin
+from raw_echarts.serializer import PrecisionMixin
 
 
-class Series3D(Option):
+class Series3D(PackDataMixin, PrecisionMixin, Option):
+    __slots__ = ('_js_dependences', '_precision', '_tuned')
+
     type = RawOption()
     name = RawOption()
     coordinateSystem = RawOption(
@@ -31,9 +35,13 @@ class Series3D(Option):
     progressive = RawOption()
     progressiveThreshold = RawOption()
 
-    def __init__(self, type, name='', data=[], **kw):
+    def __init__(self, type, name='', data=None, **kw):
+        if data is None:
+            data = []  # a new list for each series, data is appended in place
         super().__init__(type=type, name=name, data=data, **kw)
         self._js_dependences = ['echarts.min.js', 'echarts-gl.min.js']
+        self._precision = None
+        self._tuned = {}  # options filled by `tuning.tune_series`
 
     def add_js_link(self, js_link):
         if js_link not in self._js_dependences:
@@ -42,12 +50,12 @@ class Series3D(Option):
 
 
 class Scatter3D(Series3D):
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('scatter3D', name, data, **kw)
 
 
 class Line3D(Series3D):
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('line3D', name, data, **kw)
 
 
@@ -62,7 +70,7 @@ class Bar3D(Series3D):
     lambertMaterial = Material()
     colorMaterial = Material()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('bar3D', name, data, **kw)
 
 
@@ -82,7 +90,7 @@ class Map3D(PositionMixin, ShadingMixin, Option):
 
     data = RawOption([])
 
-    def __init__(self, map='china', name='', data=[], **kw):
+    def __init__(self, map='china', name='', data=None, **kw):
         new_data = _parse_data_pair(data, columns=['name', 'value', 'label'])
         super().__init__('map3D', name, new_data, map=map, **kw)
         MAPS.load_data()
@@ -102,7 +110,7 @@ class Lines3D(Series3D):
     polyline = RawOption()
     effect = Lines3DEffect()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('lines3D', name, data, **kw)
 
 
@@ -120,19 +128,19 @@ class Surface(ShadingMixin, Series3D):
     parametricEquation = RawOption()
     wireframe = WireFrame()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('surface', name, data, **kw)
 
 
 class Polygons3D(ShadingMixin, Series3D):
     multiPolygon = RawOption()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('polygons3D', name, data, **kw)
 
 
 class ScatterGL(ShadingMixin, Series3D):
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('scatterGL', name, data, **kw)
 
 
@@ -167,7 +175,7 @@ class GraphGL(ShadingMixin, Series3D):
     links = GraphLink().to_array(False)
     edges = links
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('graphGL', name, data, **kw)
 
 
@@ -181,5 +189,5 @@ class FlowGL(ShadingMixin, Series3D):
     gridWidth = RawOption()
     gridHeight = RawOption()
 
-    def __init__(self, name='', data=[], **kw):
+    def __init__(self, name='', data=None, **kw):
         super().__init__('flowGL', name, data, **kw)
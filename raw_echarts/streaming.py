@@ -0,0 +1,91 @@
+'''
+append data to series of a rendered chart by `appendData`, only new points are sent instead of the whole option.
+chunks are kept in a batch and sent when there are enough points or the oldest of them waits long enough.
+'''
+from time import perf_counter
+from raw_echarts.bases import *
+
+
+__all__ = ['extend_data', 'join_chunks', 'DataBatch']
+
+
+def join_chunks(chunks):
+    '''
+    one chunk of all `chunks` in order, numpy arrays are concatenated, others are joined as list.
+    '''
+    if len(chunks) == 1:
+        return chunks[0]
+    if np is not None and all(isinstance(c, np.ndarray) for c in chunks):
+        return np.concatenate(chunks)
+    data = []
+    for c in chunks:
+        data.extend(c.tolist() if np is not None and isinstance(c, np.ndarray) else c)
+    return data
+
+
+def extend_data(data, chunk):
+    '''
+    `data` with `chunk` appended: lists and arrays are extended in place, numpy arrays are concatenated.
+    return the new data, None if `data` can't be extended (e.g. data items as dict of tree series).
+    '''
+    if data is None:
+        return join_chunks([chunk])
+    if isinstance(data, list):
+        data.extend(chunk.tolist() if np is not None and isinstance(chunk, np.ndarray) else chunk)
+        return data
+    if isinstance(data, array):
+        data.extend(chunk)
+        return data
+    if np is not None and isinstance(data, np.ndarray):
+        chunk = np.asarray(chunk)
+        if data.ndim == 2 and chunk.ndim == 1 and len(chunk) == data.shape[1]:  # one point
+            chunk = chunk.reshape(1, -1)
+        return np.concatenate((data, chunk))
+    return None
+
+
+class DataBatch:
+    '''
+    chunks of series data waiting to be sent to the chart by `send(seriesIndex, data)`.
+    max_points: send all pending chunks when they have this many points.
+    max_delay: send all pending chunks when the oldest of them waits this many seconds.
+        it's checked when chunks are added or `flush(due=True)` is called, no timer is running.
+    '''
+
+    def __init__(self, send, max_points=10000, max_delay=1.0):
+        self.send = send
+        self.max_points = max_points
+        self.max_delay = max_delay
+        self.pending = {}  # series index -> chunks
+        self.points = 0
+        self.since = None
+
+    def __len__(self):
+        return self.points
+
+    def add(self, index, chunk):
+        '''
+        keep `chunk` of series at `index`, send pending chunks if the batch is full or due.
+        '''
+        if not len(chunk):
+            return
+        self.pending.setdefault(index, []).append(chunk)
+        self.points += len(chunk)
+        if self.since is None:
+            self.since = perf_counter()
+        self.flush(due=True)
+
+    def flush(self, due=False):
+        '''
+        send pending chunks of every series as one, only when the batch is full or waits long enough with `due`.
+        '''
+        if not self.pending:
+            return
+        if due and self.points < self.max_points and perf_counter()-self.since < self.max_delay:
+            return
+        pending = self.pending
+        self.pending = {}
+        self.points = 0
+        self.since = None
+        for index, chunks in pending.items():
+            self.send(index, join_chunks(chunks))
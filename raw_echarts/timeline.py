@@ -66,12 +66,12 @@ class TimelineSeriesData(RawOption):
     def __setitem__(self, idx, val):
         if isinstance(val, list):
             val = {'data': val}
-        self._data[idx] = val
+        self._own_data()[idx] = val
 
     def append(self, val):
         if isinstance(val, list):
             val = {'data': val}
-        self._data.append(val)
+        self._own_data().append(val)
         return self
 
 
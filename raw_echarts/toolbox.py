@@ -5,6 +5,8 @@ __all__ = ['Toolbox']
 
 
 class FeatureItemMixin:
+    __slots__ = ()
+
     title = RawOption()
     icon = RawOption()
     iconStyle = ItemStyle()
@@ -0,0 +1,98 @@
+'''
+fill in large/progressive/animation options of series from their data volume, so big series don't freeze browsers.
+options set by users are kept, those filled here are recorded in `_tuned` of series and updated when tuned again.
+'''
+from raw_echarts.bases import *
+
+
+__all__ = ['tune_series', 'data_length', 'LARGE_TYPES', 'PROGRESSIVE_TYPES']
+
+
+# series types with `large` mode, on with at least LARGE_THRESHOLD items (echarts' default `largeThreshold`)
+LARGE_TYPES = frozenset(['bar', 'scatter', 'lines', 'candlestick'])
+LARGE_THRESHOLD = 2000
+
+# series types rendered in chunks over frames, chunks are 1% of data between the min and max size
+# with at least PROGRESSIVE_THRESHOLD items, smaller series are fine with echarts' defaults.
+# echarts-gl series are not here, their defaults are made for millions of points.
+PROGRESSIVE_TYPES = frozenset(['bar', 'scatter', 'lines', 'candlestick', 'heatmap', 'parallel', 'custom'])
+PROGRESSIVE_THRESHOLD = 100000
+PROGRESSIVE_MIN_CHUNK = 5000
+PROGRESSIVE_MAX_CHUNK = 50000
+
+# echarts' default `animationThreshold`
+ANIMATION_THRESHOLD = 2000
+
+
+def _value(option, key):
+    v = option._data.get(key)
+    if isinstance(v, OptionBase):
+        return v._data
+    return v
+
+
+def data_length(series, root=None):
+    '''
+    items count of `series` data, or of the dataset it uses (found in `root`), 0 if unknown
+    '''
+    data = _value(series, 'data')
+    if data is None and root is not None:
+        index = _value(series, 'datasetIndex') or 0
+        datasets = _value(root, 'dataset')
+        if datasets is not None and index < len(datasets):
+            data = _value(datasets.value_list[index], 'source')
+            if isinstance(data, dict):  # columns
+                data = next(iter(data.values()), None)
+    try:
+        return len(data)
+    except TypeError:
+        return 0
+
+
+def _fill(series, key, value, filled):
+    if key not in series._meta.params:
+        return
+    tuned = series._tuned
+    if key in series._data and (key not in tuned or _value(series, key) != tuned[key]):
+        tuned.pop(key, None)  # set by users
+        return
+    if tuned.get(key) != value or key not in series._data:
+        series.opts({key: value})
+    tuned[key] = filled[key] = value
+
+
+def tune_series(series, length=None, root=None):
+    '''
+    fill in options of `series` for its data volume, return {option: value} filled.
+    options filled by a former call are updated, or unset if they are not needed anymore, e.g. the data grows or
+    shrinks. options set by users are kept.
+        - large: on for series types having it, with as many items as echarts' `largeThreshold`.
+        - progressive: chunks of 1% of data, for series types rendered progressively and more than 100k items.
+        - progressiveChunkMode: 'mod' for scatters rendered progressively, points show up all over the chart.
+        - animation: off with more items than `animationThreshold` of the series, the chart, or echarts' default.
+    length: items count, default to `data_length(series, root)`.
+    root: the chart option, where datasets and `animationThreshold` are found.
+    '''
+    if length is None:
+        length = data_length(series, root)
+    kind = _value(series, 'type')
+    filled = {}
+
+    if kind in LARGE_TYPES and length >= LARGE_THRESHOLD:
+        _fill(series, 'large', True, filled)
+    if kind in PROGRESSIVE_TYPES and length >= PROGRESSIVE_THRESHOLD:
+        _fill(series, 'progressive', min(max(length//100, PROGRESSIVE_MIN_CHUNK), PROGRESSIVE_MAX_CHUNK), filled)
+        if kind == 'scatter':
+            _fill(series, 'progressiveChunkMode', 'mod', filled)
+
+    threshold = _value(series, 'animationThreshold')
+    if threshold is None and root is not None:
+        threshold = _value(root, 'animationThreshold')
+    if length > (ANIMATION_THRESHOLD if threshold is None else threshold):
+        _fill(series, 'animation', False, filled)
+
+    tuned = series._tuned
+    for key in [k for k in tuned if k not in filled]:
+        if _value(series, key) == tuned.pop(key):  # not changed by users
+            getattr(series, key).unuse()
+    return filled
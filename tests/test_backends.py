@@ -0,0 +1,58 @@
+import json
+from datetime import date
+import pytest
+from raw_echarts.charts import *
+from raw_echarts import bases
+
+
+BACKENDS = list(bases.JSON_BACKENDS)
+
+
+def plain_chart():
+    chart = Chart()
+    chart.title(text='ü')
+    chart.xAxis(data=[date(2020, 1, 1), 'b', None])
+    chart.yAxis.use()
+    chart.add_chart(Line('l', [1, 2.5, None]))
+    return chart
+
+
+def test_backends_available():
+    assert {'simplejson', 'json'} <= set(BACKENDS)
+    assert get_json_backend() is bases.JSON_BACKENDS['simplejson']
+    with pytest.raises(ValueError):
+        get_json_backend('nothing')
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_same_values_by_every_backend(backend, monkeypatch):
+    chart = plain_chart()
+    expected = json.loads(chart.to_json())
+    assert json.loads(dumps(chart.get_option(), backend=backend)) == expected
+    monkeypatch.setattr(CONFIG, 'JSON_BACKEND', backend)
+    assert json.loads(chart.to_json()) == expected
+    assert json.loads(chart.to_json(compact=True)) == expected
+
+
+@pytest.mark.parametrize('backend', ['simplejson', 'json'])
+def test_text_same_as_simplejson(backend):
+    option = plain_chart().get_option()
+    for indent in [4, None]:
+        assert dumps(option, indent=indent, backend=backend) == dumps(option, indent=indent)
+
+
+def test_register_backend(monkeypatch):
+    monkeypatch.setitem(bases.JSON_BACKENDS, 'upper', lambda obj, **kw: dumps(obj, backend='json', **kw).upper())
+    monkeypatch.setattr(CONFIG, 'JSON_BACKEND', 'upper')
+    assert '"TEXT": "Ü"' not in plain_chart().to_json()  # ensure_ascii
+    assert '"TEXT": "\\U00FC"' in plain_chart().to_json()
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_out_of_range_floats(backend):
+    for value in [float('inf'), float('nan')]:
+        if backend == 'orjson':
+            assert dumps({'v': value}, indent=None, backend=backend) == '{"v":null}'
+        else:
+            with pytest.raises(ValueError):
+                dumps({'v': value}, backend=backend)
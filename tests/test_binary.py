@@ -0,0 +1,35 @@
+import base64
+from array import array
+import pytest
+from raw_echarts import bases
+from raw_echarts.binary import *
+
+
+def unpack(packed):
+    text, shape, dtype = packed
+    values = array(DTYPES[dtype])
+    values.frombytes(base64.b64decode(text))
+    return values.tolist(), shape, dtype
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr('raw_echarts.binary.np', None)
+    elif bases.np is None:
+        pytest.skip('numpy is not installed')
+    return request.param
+
+
+def test_large_values_packed_as_f8(backend):
+    data = [[1760000000123, 1], [1760000001123, 2]]
+    values, shape, dtype = unpack(pack_values(data))
+    assert dtype == 'f8'
+    assert shape == [2, 2]
+    assert values == [1760000000123, 1, 1760000001123, 2]
+
+
+def test_small_values_packed_as_f4(backend):
+    values, shape, dtype = unpack(pack_values([1, 2.5, None, 2**24]))
+    assert dtype == 'f4'
+    assert values[:2] == [1, 2.5] and values[2] != values[2] and values[3] == 2**24
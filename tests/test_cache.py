@@ -0,0 +1,83 @@
+import pytest
+from raw_echarts.charts import *
+from raw_echarts import serializer
+
+
+@pytest.fixture(autouse=True)
+def cache_json(monkeypatch):
+    monkeypatch.setattr(CONFIG, 'CACHE_JSON', True)
+
+
+def fresh_json(chart):
+    return serializer.dumps(chart._option, cache=False, precision=chart.precision)
+
+
+def sample_chart():
+    chart = Chart()
+    chart.xAxis(data=['a', 'b'])
+    chart.yAxis.use()
+    chart.add_chart(Line('l', [1, 2]))
+    return chart
+
+
+def mutations():
+    np = pytest.importorskip('numpy')
+    return [
+        lambda c: setattr(c.series[0], 'name', 'q'),
+        lambda c: c.series[0].data.append(3),
+        lambda c: c.series[0]['data'].append(4),
+        lambda c: c.xAxis[0].data.append('c'),
+        lambda c: c.series[0].lineStyle.opts(width=3),
+        lambda c: c._option.series[0].__delattr__('lineStyle'),
+        lambda c: c.series[0].set_precision(1),
+        lambda c: c.set_precision(2),
+        lambda c: c.series[0].data.set(np.array([1.234, 2.345])),
+        lambda c: c.series[0].downsample(2),
+        lambda c: c.series[0].append_data([5.5]),
+        lambda c: c.series[0].pack_data('f4'),
+        lambda c: c.series[0].append_data([7]),
+        lambda c: c.title.textStyle(color='red'),
+        lambda c: c.legend.data.append('zz'),
+        lambda c: c.add_chart(Bar('b', [1])),
+        lambda c: c.series.remove(0),
+        lambda c: c.opts(color=['red']),
+        lambda c: c.color.append('blue'),
+    ]
+
+
+def test_cached_json_follows_changes():
+    chart = sample_chart()
+    for change in mutations():
+        chart.to_json()
+        change(chart)
+        assert chart.to_json() == fresh_json(chart)
+
+
+def test_json_cached():
+    chart = sample_chart()
+    text = chart.to_json()
+    assert chart.series[0]._json is not None and chart.xAxis._json is not None
+    assert chart._option._json is None  # legend data holds series names, options not tracked
+    assert chart.to_json() == text == fresh_json(chart)
+
+
+def test_clones_cached_apart():
+    chart = sample_chart()
+    chart.to_json()
+    other = chart.clone()
+    other.to_json()
+    other.series[0].data.append(3)
+    other.series[0]['data'].append(4)
+    assert chart.to_json() == fresh_json(chart)
+    assert other.to_json() == fresh_json(other)
+    assert chart.to_json() != other.to_json()
+
+
+def test_cache_off_by_default(monkeypatch):
+    monkeypatch.setattr(CONFIG, 'CACHE_JSON', False)
+    data = [1, 2]
+    chart = Chart()
+    chart.add_chart(Line('l', data))
+    chart.to_json()
+    data.append(3)  # changed in place, not through options
+    assert '3' in chart.to_json(compact=True)
@@ -0,0 +1,47 @@
+import json
+from raw_echarts.charts import *
+from raw_echarts.page import Page
+
+
+def sample_chart(chart_id='c1'):
+    chart = Chart(chart_id=chart_id)
+    chart.title(text='a b')
+    chart.xAxis(data=['x', 'y'])
+    chart.yAxis.use()
+    chart.add_chart(Bar('bar', [1, 2.5]).opts(label={'formatter': JsCode('function(p){return p.value;}')}))
+    return chart
+
+
+def test_compact_json():
+    chart = sample_chart()
+    text = chart.to_json(compact=True)
+    assert text == dumps(chart.get_option(), indent=None, separators=COMPACT_SEPARATORS)
+    assert '\n' not in text and '": ' not in text and ', "' not in text
+    assert '"text":"a b"' in text  # spaces in strings are kept
+
+
+def test_compact_config(monkeypatch):
+    chart = sample_chart()
+    pretty, compact = chart.to_json(), chart.to_json(compact=True)
+    monkeypatch.setattr(CONFIG, 'COMPACT_OUTPUT', True)
+    assert chart.to_json() == compact
+    assert chart.to_json(compact=False) == pretty
+    assert chart.render_embed() == chart.render_embed(compact=True)
+    assert chart.render_file() == chart.render_file(compact=True)
+
+
+def test_compact_html():
+    chart = sample_chart()
+    embed = chart.render_embed(compact=True)
+    assert '\n' not in embed
+    assert chart.to_json(compact=True) in embed
+    html = chart.render_file(compact=True)
+    assert html.startswith('<!DOCTYPE html>\n<html>') and html.count('\n') == 1
+    page = Page(sample_chart('a'), sample_chart('b')).render_file(compact=True)
+    assert page.count('\n') == 1
+
+
+def test_compact_same_values():
+    chart = sample_chart()
+    chart.series[0].label.formatter = 'x'
+    assert json.loads(chart.to_json(compact=True)) == json.loads(chart.to_json())
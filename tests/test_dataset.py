@@ -0,0 +1,29 @@
+import json
+from array import array
+from raw_echarts.charts import *
+
+
+def test_from_rows_header():
+    ds = DataSet.from_rows([['t', 'v'], [1, 2.5], [2, 3.5]])
+    option = to_plain(ds._data)
+    assert option['dimensions'] == ['t', 'v']
+    assert option['source'] == {'t': [1, 2], 'v': [2.5, 3.5]}
+
+
+def test_from_rows_keeps_dimensions():
+    dimensions = [{'name': 't', 'type': 'time'}, 'v']
+    ds = DataSet.from_rows([[1, 2.5], [2, 3.5]], dimensions=dimensions)
+    option = to_plain(ds._data)
+    assert option['dimensions'] == dimensions
+    assert option['source'] == {'t': [1, 2], 'v': [2.5, 3.5]}
+
+
+def test_get_option_plain_lists():
+    chart = Chart()
+    chart.add_dataset({'t': [1, 2], 'v': [2.5, 3.5], 'k': ['a', 'b']})
+    chart.add_chart(Line('v').use_dataset(0, encode={'x': 't', 'y': 'v'}))
+    source = chart.get_option()['dataset'][0]['source']
+    assert source == {'t': [1, 2], 'v': [2.5, 3.5], 'k': ['a', 'b']}
+    assert all(type(v) is list for v in source.values())
+    assert json.loads(json.dumps(chart.get_option())) == json.loads(chart.to_json())
+    assert type(chart.dataset[0].source._data['t']) is array  # still compact inside
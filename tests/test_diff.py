@@ -0,0 +1,90 @@
+import pytest
+from raw_echarts.charts import *
+from raw_echarts.diff import option_delta as delta_of
+
+
+OLD = {'title': {'text': 'a'}, 'series': [{'name': 's1', 'data': [1, 2]}, {'name': 's2', 'data': [3]}]}
+
+
+def test_first_option_not_merged():
+    assert delta_of(None, OLD) == (OLD, True)
+
+
+def test_nothing_changed():
+    assert delta_of(OLD, {'title': {'text': 'a'}, 'series': [{'name': 's1', 'data': [1, 2]}, {'name': 's2', 'data': [3]}]}) \
+        == (None, False)
+
+
+def test_merge_changed_items():
+    new = {'title': {'text': 'a'}, 'series': [{'name': 's1', 'data': [1, 2, 3]}, {'name': 's2', 'data': [3]}]}
+    assert delta_of(OLD, new) == ({'series': [{'name': 's1', 'data': [1, 2, 3]}]}, False)
+
+    new = {'title': {'text': 'b'}, 'series': [{'name': 's1', 'data': [1, 2]}, {'name': 's2', 'data': [4]}]}
+    assert delta_of(OLD, new) == ({'title': [{'text': 'b'}], 'series': [{'name': 's1'}, {'name': 's2', 'data': [4]}]}, False)
+
+
+def test_merge_added():
+    new = dict(OLD, legend={'show': True}, series=OLD['series']+[{'name': 's3', 'data': []}])
+    assert delta_of(OLD, new) == ({'legend': {'show': True}, 'series': [{'name': 's1'}, {'name': 's2'},
+                                                                         {'name': 's3', 'data': []}]}, False)
+
+
+def test_nested_dicts_merged():
+    old = {'series': [{'name': 's', 'lineStyle': {'width': 1, 'color': 'red'}}]}
+    new = {'series': [{'name': 's', 'lineStyle': {'width': 2, 'color': 'red'}}]}
+    assert delta_of(old, new) == ({'series': [{'name': 's', 'lineStyle': {'width': 2}}]}, False)
+
+
+@pytest.mark.parametrize('new', [
+    {'series': OLD['series']},  # title removed
+    {'title': {}, 'series': OLD['series']},  # title text removed
+    {'title': {'text': 'a'}, 'series': OLD['series'][:1]},  # series removed
+    {'title': {'text': 'a'}, 'series': OLD['series'][::-1]},  # series reordered
+    dict(OLD, baseOption={}),
+])
+def test_not_merged(new):
+    assert delta_of(OLD, new) == (new, True)
+
+
+def test_numpy_values():
+    np = pytest.importorskip('numpy')
+    old = {'series': [{'name': 's', 'data': np.arange(3)}]}
+    assert delta_of(old, {'series': [{'name': 's', 'data': np.arange(3)}]}) == (None, False)
+    delta, not_merge = delta_of(old, {'series': [{'name': 's', 'data': np.arange(4)}]})
+    assert not not_merge and delta['series'][0]['data'].tolist() == [0, 1, 2, 3]
+
+
+class RecordingNotebook:
+    def __init__(self):
+        self.js = []
+
+    def run_js(self, js):
+        self.js.append(js)
+
+
+def test_update_option():
+    chart = Chart(chart_id='c')
+    chart.notebook = notebook = RecordingNotebook()
+    chart.add_chart(Line('l', [1, 2]))
+    chart.update_option()
+    assert notebook.js[-1].startswith('chart_c.setOption({') and notebook.js[-1].endswith(',true,false)')
+
+    chart.update_option()
+    assert len(notebook.js) == 1
+
+    chart.series[0].data.append(3)
+    chart.update_option(lazyUpdate=True)
+    assert notebook.js[-1] == 'chart_c.setOption({"series":[{"name":"l","data":[1,2,3]}]},false,true)'
+
+    chart.series.remove(0)
+    chart.update_option()
+    assert notebook.js[-1].endswith(',true,false)') and '"series":[]' in notebook.js[-1]
+
+
+def test_option_delta_commit():
+    chart = Chart()
+    chart.add_chart(Line('l', [1, 2]))
+    assert chart.option_delta(commit=False)[1] is True
+    assert chart.option_delta(commit=False)[1] is True
+    chart.option_delta()
+    assert chart.option_delta() == (None, False)
@@ -0,0 +1,52 @@
+import os
+import pickle
+from raw_echarts.charts import *
+from raw_echarts.export import export_files
+
+
+def bar_chart(i=0):
+    chart = Chart()
+    chart.xAxis(data=['a', 'b', 'c'])
+    chart.yAxis.use()
+    chart.add_chart(Bar(f'bar{i}', [i, i+1, i+2]))
+    return chart
+
+
+def test_export_files_paths(tmp_path):
+    jobs = [(bar_chart(0), str(tmp_path/'a')), (bar_chart(1), str(tmp_path/'b.html')), (bar_chart, str(tmp_path/'c'))]
+    for workers, threads in [(0, False), (2, True), (2, False)]:
+        results = list(export_files(jobs, workers=workers, threads=threads))
+        assert [path for path, error in results] == [str(tmp_path/name) for name in ['a.html', 'b.html', 'c.html']]
+        assert all(error is None and os.path.exists(path) for path, error in results)
+
+
+def test_export_files_errors(tmp_path):
+    results = list(export_files([(lambda: 1/0, str(tmp_path/'a'))], workers=1, threads=True))
+    assert isinstance(results[0][1], ZeroDivisionError)
+
+
+def test_pickled_chart_same_output():
+    chart = bar_chart()
+    chart.title(text='t')
+    chart.set_precision(digits=3)
+    other = pickle.loads(pickle.dumps(chart))
+    assert other.to_json() == chart.to_json()
+    assert other.render_embed() == chart.render_embed()
+
+
+def test_config_in_workers(tmp_path, monkeypatch):
+    monkeypatch.setattr(CONFIG, 'COMPACT_OUTPUT', True)
+    chart = bar_chart()
+    results = list(export_files([(chart, str(tmp_path/'a'))], workers=1))
+    assert results == [(str(tmp_path/'a.html'), None)]
+    assert (tmp_path/'a.html').read_text(encoding='utf-8') == chart.render_file()
+
+
+def test_pickled_clone():
+    chart = bar_chart()
+    clone = chart.clone()  # borrows options of the chart
+    clone.series[0].data.append(9)
+    other = pickle.loads(pickle.dumps(clone))
+    assert other.get_option() == clone.get_option()
+    other.title.text = 'x'
+    assert 'title' not in clone.get_option() and 'title' not in chart.get_option()
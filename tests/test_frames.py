@@ -0,0 +1,31 @@
+import json
+import pytest
+from raw_echarts.charts import *
+
+pd = pytest.importorskip('pandas')
+
+
+def frame():
+    return pd.DataFrame({'t': pd.date_range('2020-01-01', periods=3), 'v': [1.5, None, 3]})
+
+
+def test_datetime_x_with_gap():
+    option = json.loads(Chart.from_dataframe(frame(), x='t').to_json())
+    assert option['xAxis'][0]['type'] == 'time'
+    assert option['series'][0]['data'] == [['2020-01-01', 1.5], ['2020-01-02', None], ['2020-01-03', 3.0]]
+
+
+def test_datetime_index_with_gap():
+    option = json.loads(Chart.from_dataframe(frame().set_index('t')).to_json())
+    assert option['series'][0]['data'][1] == ['2020-01-02', None]
+
+
+def test_series_from_frame_with_gap():
+    series = Line.from_frame(frame(), 'v', x='t')
+    expected = [['2020-01-01', 1.5], ['2020-01-02', None], ['2020-01-03', 3.0]]
+    assert json.loads(dumps(to_plain(series.data))) == expected
+
+
+def test_numeric_column_with_gap():
+    option = json.loads(Chart.from_dataframe(frame(), x='t', dates='ms').to_json())
+    assert [y for x, y in option['series'][0]['data']] == [1.5, None, 3.0]
@@ -0,0 +1,83 @@
+from raw_echarts.charts import *
+
+
+# html written by the former lxml based renderer
+EXPECTED = (
+    '<!DOCTYPE html>\n'
+    '<html>\n'
+    '<head>\n'
+    '<meta charset="UTF-8">\n'
+    '<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+    '<meta name="theme-color" content="#000000">\n'
+    '<meta name="description" content="Awesome ECharts">\n'
+    '<title>Awesome Echarts</title>\n'
+    '<script type="text/javascript" src="http://127.0.0.1/assets//echarts.min.js"></script><script type="text/javascript" src="x.js"></script>\n'
+    '</head>\n'
+    '<body>\n'
+    '<noscript>you should enable javascript to run this app.</noscript>\n'
+    '<div id="c2_container"><div id="c2" class="chart-container" style="width:50%;height:300px;"><script>\n'
+    '        var chart_c2=echarts.init(document.getElementById("c2"),"white",{"renderer":"canvas"});\n'
+    '        var option_c2={\n'
+    '    "series": [\n'
+    '        {\n'
+    '            "type": "bar",\n'
+    '            "name": "y",\n'
+    '            "data": [\n'
+    '                1,\n'
+    '                2,\n'
+    '                3\n'
+    '            ]\n'
+    '        }\n'
+    '    ],\n'
+    '    "legend": {\n'
+    '        "data": [\n'
+    '            "y"\n'
+    '        ],\n'
+    '        "selected": {\n'
+    '            "y": true\n'
+    '        }\n'
+    '    }\n'
+    '};\n'
+    '        chart_c2.setOption(option_c2);\n'
+    '        </script></div></div>\n'
+    '</body>\n'
+    '</html>\n'
+)
+
+
+def sample_chart():
+    chart = Chart(chart_id='c2', width=0.5, height=300)
+    chart.add_chart(Bar('y', [1, 2, 3]))
+    chart._js_dependences = ['x.js']
+    return chart
+
+
+def test_same_html_as_before():
+    assert sample_chart().render_file() == EXPECTED
+
+
+def test_embed_in_file():
+    chart = sample_chart()
+    embed = chart.render_embed()
+    assert embed.startswith('<div id="c2_container"><div id="c2" class="chart-container" style="width:50%;height:300px;">')
+    assert embed.endswith('</script></div></div>\n')
+    assert chart.to_json() in embed
+    assert embed in chart.render_file()
+
+
+def test_escaped():
+    chart = Chart(chart_id='c"1')
+    chart._js_dependences = ['a&b.js']
+    html = chart.render_file(title='T&<>"x ü')
+    assert '<title>T&amp;&lt;&gt;"x &#252;</title>' in html
+    assert 'src="a&amp;b.js"' in html
+    assert '<div id="c&quot;1"' in html
+
+
+def test_iter_html():
+    chart = sample_chart()
+    for compact in [False, True]:
+        html = chart.render_file(compact=compact)
+        assert ''.join(chart.iter_html(compact=compact)) == html
+        assert b''.join(chart.iter_html(compact=compact, encoding='utf-8')) == html.encode()
+
@@ -0,0 +1,43 @@
+import pytest
+from raw_echarts.charts import *
+from raw_echarts import bases, serializer
+
+
+BACKENDS = list(bases.JSON_BACKENDS)
+
+
+def codes_option():
+    return {
+        'a': JsCode('function(p){return "a";}'),
+        'b': [JsCode('1+1'), 'text', JsCode(r'/\d+/.test(s) ? "\\1" : s')],
+        'c': {'d': JsCode('x')},
+    }
+
+
+# compact, as orjson writes it
+EXPECTED = '{"a":function(p){return "a";},"b":[1+1,"text",/\\d+/.test(s) ? "\\\\1" : s],"c":{"d":x}}'
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_codes_put_in_order(backend):
+    assert dumps(codes_option(), indent=None, separators=COMPACT_SEPARATORS, backend=backend) == EXPECTED
+
+
+def test_writer_codes_put_in_order():
+    assert serializer.dumps(codes_option(), indent=None, separators=COMPACT_SEPARATORS) == EXPECTED
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_strings_like_placeholders_kept(backend):
+    value = {'s': 'jscode-0', 't': JsCode('f'), 'u': '--x_x--0_0--'}
+    text = dumps(value, indent=None, separators=COMPACT_SEPARATORS, backend=backend)
+    assert text == '{"s":"jscode-0","t":f,"u":"--x_x--0_0--"}'
+
+
+def test_chart_codes():
+    chart = Chart()
+    chart.tooltip(formatter=JsCode('function(p){return p.name;}'))
+    chart.add_chart(Bar('b', [1]).opts(color=JsCode('c')))
+    text = chart.to_json()
+    assert '"formatter": function(p){return p.name;}' in text and '"color": c' in text
+    assert text == dumps(chart.get_option())
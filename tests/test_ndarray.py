@@ -0,0 +1,63 @@
+import json
+import pytest
+from raw_echarts.charts import *
+from raw_echarts import bases, serializer
+
+np = pytest.importorskip('numpy')
+
+
+ARRAYS = [
+    np.arange(5),
+    np.arange(5, dtype='uint8'),
+    np.array([0.1, 2.5, -3e300, 1e-7]),
+    np.array([0.1, 2.5], 'f4'),
+    np.arange(6).reshape(3, 2),
+    np.array([[0.5, 1], [2, 3.25]]),
+    np.array([True, False]),
+    np.array(['a', 'b']),
+    np.array([[1, 'a']], dtype=object),
+    np.arange(8).reshape(2, 2, 2),
+    np.zeros((2, 0)),
+    np.array([]),
+]
+
+
+@pytest.mark.parametrize('a', ARRAYS, ids=range(len(ARRAYS)))
+def test_same_as_lists(a):
+    for indent in [4, None]:
+        expected = dumps({'data': a.tolist()}, indent=indent)
+        assert serializer.dumps({'data': a}, indent=indent) == expected
+        for backend in bases.JSON_BACKENDS:
+            data = json.loads(dumps({'data': a}, backend=backend))['data']
+            if backend == 'orjson' and a.dtype == 'f4':  # shortest float32 repr, same float32 values
+                assert np.array(data, 'f4').tolist() == a.tolist()
+            else:
+                assert data == json.loads(expected)['data']
+
+
+def test_series_data_not_converted():
+    a = np.arange(10000)*0.5
+    chart = Chart()
+    chart.add_chart(Line('l', a))
+    assert chart.series[0].data._data is a
+    assert json.loads(chart.to_json())['series'][0]['data'] == a.tolist()
+
+
+def test_nan_as_null():
+    cases = [
+        (np.array([1.5, np.nan, 3]), [1.5, None, 3]),
+        (np.array([[1, np.nan], [np.nan, 2.5]]), [[1, None], [None, 2.5]]),
+        (np.array([np.nan], 'f4'), [None]),
+    ]
+    for a, expected in cases:
+        assert bases.ndarray_list(a) == expected
+        assert json.loads(serializer.dumps({'data': a})) == {'data': expected}
+        for precision in [3, ('f', 1)]:
+            assert 'NaN' not in serializer.dumps({'data': a}, precision=precision)
+        for backend in bases.JSON_BACKENDS:
+            assert json.loads(dumps({'data': a}, backend=backend)) == {'data': expected}
+
+
+def test_inf_rejected():
+    with pytest.raises(ValueError):
+        serializer.dumps({'data': np.array([1, np.inf])})
@@ -0,0 +1,34 @@
+from raw_echarts.charts import *
+
+
+def test_strict_chart_reaches_added_series():
+    c = Chart(strict=True)
+    c.add_chart(Line('a', [1, 2]))
+    c.series[0].opts(smoth=True)
+    c.xAxis.opts(type='val')
+    option = c.get_option()
+    assert option['series'][0]['smoth'] is True
+    assert 'smooth' not in option['series'][0]
+    assert option['xAxis'][0]['type'] == 'val'
+
+
+def test_strict_chart_reaches_nested_series_option():
+    c = Chart(strict=True)
+    c.add_chart(Line('a', [1, 2]))
+    c.series[0].lineStyle.opts(widht=2)
+    assert c.get_option()['series'][0]['lineStyle'] == {'widht': 2}
+
+
+def test_strict_reaches_clone():
+    c = Chart(strict=True)
+    c.add_chart(Line('a', [1, 2]))
+    k = c.clone()
+    k.series[0].opts(smoth=True)
+    assert 'smoth' in k.get_option()['series'][0]
+
+
+def test_fuzzy_params_without_strict():
+    c = Chart(strict=False)
+    c.add_chart(Line('a', [1]))
+    c.series[0].opts(smoth=True)
+    assert c.get_option()['series'][0]['smooth'] is True
@@ -0,0 +1,52 @@
+import pytest
+from raw_echarts.charts import *
+from raw_echarts.page import Page
+
+
+def bar_chart(i, deps=()):
+    chart = Chart(chart_id=f'c{i}')
+    chart.add_chart(Bar(f'bar{i}', [i, i+1]))
+    chart._js_dependences = list(deps)
+    return chart
+
+
+def test_charts_in_page():
+    charts = [bar_chart(0), bar_chart(1)]
+    page = Page(*charts, title='T&')
+    assert len(page) == 2 and list(page) == charts
+    html = page.render_file()
+    assert html.startswith('<!DOCTYPE html>') and '<title>T&amp;</title>' in html
+    for c in charts:
+        assert f'<div id="{c.chart_id}" class="chart-container"' in html
+        assert f'var chart_{c.chart_id}=raw_echarts_init("{c.chart_id}",{c.to_json()});' in html
+    assert html.count('function raw_echarts_init') == 1
+    assert 'echarts.connect' not in html
+
+
+def test_dependences_once(monkeypatch):
+    monkeypatch.setattr(CONFIG, 'ECHARTS_ASSETS', 'http://host/assets/')
+    page = Page(bar_chart(0, ['echarts.min.js', 'map/china.js']), bar_chart(1, ['map/china.js', 'https://x/y.js']))
+    assert page.js_dependences == ['http://host/assets/echarts.min.js', 'http://host/assets/map/china.js',
+                                   'https://x/y.js']
+    assert page.render_file().count('map/china.js') == 1
+
+
+def test_connect():
+    html = Page(bar_chart(0), bar_chart(1), connect=True).render_file(compact=True)
+    assert '<script>echarts.connect([chart_c0,chart_c1]);</script>' in html
+    assert 'echarts.connect' not in Page(bar_chart(0), connect=True).render_file()
+
+
+def test_same_chart_id():
+    page = Page(bar_chart(0))
+    with pytest.raises(ValueError):
+        page.add(bar_chart(0))
+
+
+def test_iter_html_and_file(tmp_path):
+    page = Page(bar_chart(0), bar_chart(1))
+    html = page.render_file()
+    assert ''.join(page.iter_html()) == html
+    assert b''.join(page.iter_html(encoding='utf-8')) == html.encode()
+    assert page.render_file(str(tmp_path/'page')) is None
+    assert (tmp_path/'page.html').read_text(encoding='utf-8') == html
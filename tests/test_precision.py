@@ -0,0 +1,58 @@
+import json
+import pytest
+from raw_echarts.charts import *
+from raw_echarts.serializer import *
+
+
+def test_float_format():
+    assert float_format(None)(0.1+0.2) == '0.30000000000000004'
+    assert float_format(3)(3.14159) == '3.14'
+    assert float_format(3)(123456.0) == '1.23e+05'
+    assert float_format(('f', 2))(3.14159) == '3.14'
+    assert float_format(('f', 0))(2.5) == '2.0'
+    with pytest.raises(ValueError):
+        float_format(('g', 2))
+
+
+def test_parse_precision():
+    assert parse_precision() is None
+    assert parse_precision(digits=4) == 4
+    assert parse_precision(decimals=2) == ('f', 2)
+    with pytest.raises(ValueError):
+        parse_precision(digits=2, decimals=2)
+    with pytest.raises(ValueError):
+        parse_precision(digits=0)
+
+
+def test_chart_and_series_precision():
+    chart = Chart()
+    chart.add_chart(Line('a', [1.23456, 2]))
+    chart.add_chart(Line('b', [1.23456, 2], symbolSize=1.23456))
+    chart.set_precision(digits=3)
+    chart.series[1].set_precision(decimals=1)
+    series = json.loads(chart.to_json())['series']
+    assert series[0]['data'] == [1.23, 2]
+    assert series[1]['data'] == [1.2, 2]
+    assert series[1]['symbolSize'] == 1.23456  # not in ROUNDED_KEYS
+    assert chart.series[0].data._data == [1.23456, 2]  # stored data is kept
+
+    chart.series[1].set_precision()
+    assert json.loads(chart.to_json())['series'][1]['data'] == [1.23, 2]
+
+
+def test_ndarray_same_as_lists():
+    np = pytest.importorskip('numpy')
+    arrays = [np.array([0.11, 1.005, 2.675], 'f4'), np.array([[0.111, 2.555], [1e300, -3.5]]),
+              np.array([3.4e38, -3.4e38], 'f4'), np.array([1.7e308, 1.23456])]
+    for precision in [None, 3, ('f', 2)]:
+        for a in arrays:
+            assert dumps({'data': a}, precision=precision) == dumps({'data': a.tolist()}, precision=precision)
+
+
+def test_float32_fixed_decimals():
+    np = pytest.importorskip('numpy')
+    assert dumps({'data': np.array([0.11, 2.5], 'f4')}, indent=None, precision=('f', 2)) == '{"data": [0.11, 2.5]}'
+    text = dumps({'data': np.array([3.4e38], 'f4')}, indent=None, precision=('f', 2))
+    assert json.loads(text)['data'][0] == pytest.approx(3.4e38, rel=1e-6)
+    with pytest.raises(ValueError):
+        dumps({'data': np.array([np.inf])}, precision=('f', 2))
@@ -0,0 +1,54 @@
+import io
+import gzip
+from raw_echarts.charts import *
+
+
+def sample_chart():
+    chart = Chart(chart_id='c1')
+    chart.title(text='ü')
+    chart.add_chart(Line('l', [i*0.5 for i in range(50000)]))
+    return chart
+
+
+class Sink:
+    '''
+    not seekable, like a socket or a wsgi response
+    '''
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, chunk):
+        self.chunks.append(chunk)
+
+
+def test_path(tmp_path):
+    chart = sample_chart()
+    html = chart.render_file()
+    assert chart.render_file(str(tmp_path/'a')) is None
+    assert (tmp_path/'a.html').read_text(encoding='utf-8') == html
+    chart.render_file(str(tmp_path/'b.html'))
+    assert (tmp_path/'b.html').read_text(encoding='utf-8') == html
+
+
+def test_text_and_binary_files(tmp_path):
+    chart = sample_chart()
+    html = chart.render_file(compact=True)
+    buf = io.StringIO()
+    chart.render_file(buf, compact=True)
+    assert buf.read() == html  # rewound
+    buf = io.BytesIO()
+    chart.render_file(buf, compact=True)
+    assert buf.getvalue() == html.encode('utf-8')
+    with gzip.open(tmp_path/'c.html.gz', 'wb') as fp:
+        chart.render_file(fp, compact=True)
+    with gzip.open(tmp_path/'c.html.gz', 'rt', encoding='utf-8') as fp:
+        assert fp.read() == html
+
+
+def test_not_seekable_sink():
+    chart = sample_chart()
+    sink = Sink()
+    chart.render_file(sink)
+    assert len(sink.chunks) > 3
+    assert ''.join(sink.chunks) == chart.render_file()
@@ -0,0 +1,40 @@
+import random
+import pytest
+from raw_echarts.bases import LazyValue
+from raw_echarts import sampling
+from raw_echarts.sampling import *
+from raw_echarts.charts import Line
+
+
+def test_lttb_same_with_and_without_numpy():
+    rnd = random.Random(1)
+    for n, threshold in [(10, 3), (101, 7), (1000, 50), (9999, 4)]:
+        y = [rnd.random() for _ in range(n)]
+        x = list(range(n))
+        indices = sampling._lttb_python(x, y, threshold)
+        assert list(lttb_indices(x, y, threshold)) == indices
+
+
+def test_short_values_same_shape():
+    assert Sampled([1, 2, None, 4], 10).value() == [[0, 1], [1, 2], [3, 4]]
+    assert Sampled([1, 2, 3, 4, 5], 3).value() == [[0, 1], [1, 2], [4, 5]]
+    points = [[0, 1], [1, 2]]
+    assert Sampled(points, 10).value() == points
+
+
+def test_lazy_value_needs_value():
+    class Empty(LazyValue):
+        pass
+    try:
+        Empty()
+    except TypeError:
+        pass
+    else:
+        assert False, 'LazyValue subclasses should define value()'
+
+
+def test_downsample_dataset_series():
+    series = Line('l').use_dataset(0)
+    with pytest.raises(ValueError):
+        series.downsample(10)
+    assert 'data' not in series._data
@@ -0,0 +1,65 @@
+import io
+from datetime import date, datetime
+import pytest
+from raw_echarts.charts import *
+from raw_echarts import serializer
+from raw_echarts.timeline import TimelineChart
+
+
+def sample_chart():
+    chart = Chart(chart_id='c1')
+    chart.title(text='title "quoted" ü', sub='sub')
+    chart.xAxis(data=[date(2020, 1, 1), datetime(2020, 1, 2, 3, 4), 'x', None, True, 1.5e300, (1, 2)])
+    chart.yAxis.use()
+    chart.tooltip(formatter=JsCode('function(p){return p.value;}'))
+    bar = Bar('bar', [1, 2.5, None, -3])
+    bar.label(show=True)
+    chart.add_chart(bar)
+    chart.add_chart(Scatter('scatter', [[1, 2], [3, 4.5], [{'value': 1}, 'a']]))
+    return chart
+
+
+def timeline_chart():
+    chart = TimelineChart()
+    chart.title(text='a')
+    chart.add_chart(Radar('radar', [{'name': 'p', 'value': [1, 2, 3]}]))
+    chart.add_page('page 1', 'page1', [[{'name': 'p1', 'value': [2, 2]}]])
+    return chart
+
+
+@pytest.mark.parametrize('build', [sample_chart, timeline_chart, Chart])
+def test_same_as_dumps_of_plain_option(build):
+    chart = build()
+    option = chart.get_option()
+    assert chart.to_json() == dumps(option)
+    assert chart.to_json(indent=None) == dumps(option, indent=None)
+    assert chart.to_json(indent=2) == dumps(option, indent=2)
+    assert serializer.dumps(chart._option, sort_keys=True) == dumps(option, sort_keys=True)
+    assert serializer.dumps(chart._option, ensure_ascii=False) == dumps(option, ensure_ascii=False)
+
+
+def test_write_json_in_chunks():
+    chart = Chart()
+    chart.add_chart(Line('l', [i*0.5 for i in range(100000)]))
+    expected = dumps(chart.get_option())
+    buf = io.StringIO()
+    chart.write_json(buf)
+    assert buf.getvalue() == expected
+
+    chunks = list(serializer.JsonWriter().iterencode(chart._option))
+    assert len(chunks) > 1
+    assert ''.join(chunks) == expected
+
+
+def test_plain_values():
+    value = {'a': [1, 2.5, None, True, 'x'], 'b': {'c': date(2020, 1, 1)}, 'd': (), 'e': {}}
+    assert serializer.dumps(value) == dumps(value)
+    assert serializer.dumps(value, indent=None) == dumps(value, indent=None)
+
+
+def test_out_of_range_floats():
+    for value in [float('nan'), float('inf')]:
+        with pytest.raises(ValueError):
+            serializer.dumps({'data': [1, value]})
+        with pytest.raises(ValueError):
+            serializer.dumps({'v': value})
@@ -0,0 +1,71 @@
+import json
+from raw_echarts.charts import *
+
+
+class RecordingNotebook:
+    def __init__(self):
+        self.calls = []
+
+    def run_js(self, js):
+        func, args = js.split('.', 1)[1].split('(', 1)
+        try:
+            args = json.loads('[{}]'.format(args[:-1]))
+        except ValueError:  # with js code
+            pass
+        self.calls.append((func, args))
+
+
+def test_update_option_sends_pending_data_first():
+    chart = Chart()
+    chart.notebook = notebook = RecordingNotebook()
+    chart.add_chart(Line('l', data=[1, 2, 3]))
+    chart.update_option()
+    chart.batch_data(max_points=100, max_delay=60)
+    chart.append_data(0, [4, 5])
+    chart.update_option()
+    chart.flush_data()
+
+    assert [func for func, args in notebook.calls] == ['setOption', 'appendData']
+    assert notebook.calls[1][1] == [{'seriesIndex': 0, 'data': [4, 5]}]
+    assert chart._pushed_option['series'][0]['data'] == [1, 2, 3, 4, 5]
+    assert chart.option_delta() == (None, False)
+
+
+def test_append_to_wrapped_data_in_place():
+    chart = Chart()
+    chart.add_chart(Line('l', data=[1, 2, 3]))
+    series = chart.series[0]
+    series.downsample(100).pack_data('f8')
+    packed = series.data._data
+    buffer = packed.data.data
+
+    series.append_data([4, 5])
+    assert series.data._data is packed
+    assert packed.data.data is buffer and buffer == [1, 2, 3, 4, 5]
+
+    other = chart.clone()
+    other.series[0].append_data([6])
+    series.append_data([7])
+    assert other.series[0].data._data.data.data == [1, 2, 3, 4, 5, 6]
+    assert series.data._data.data.data == [1, 2, 3, 4, 5, 7]
+    assert chart.get_option()['series'][0]['data'] != other.get_option()['series'][0]['data']
+
+
+def test_packed_data_unchanged_not_sent_again():
+    chart = Chart()
+    chart.notebook = notebook = RecordingNotebook()
+    chart.add_chart(Line('l', list(range(1000))).pack_data('f8'))
+    chart.update_option()
+    chart.title(text='t')
+    assert chart.option_delta() == ({'title': {'text': 't'}}, False)
+    chart.series[0].append_data([1000])
+    delta, not_merge = chart.option_delta(commit=False)
+    assert list(delta) == ['series'] and not not_merge
+
+
+def test_append_data_to_series_without_data():
+    a, b = Line('a'), Line('b')
+    a.append_data([1, 2])
+    assert to_plain(a.data) == [1, 2]
+    assert to_plain(b.data) == []
+    assert to_plain(Bar('c').data) == []
@@ -0,0 +1,32 @@
+from raw_echarts.charts import *
+
+
+def tuned_options(chart):
+    option = chart.get_option()['series'][0]
+    return {k: option[k] for k in ['large', 'progressive', 'progressiveChunkMode', 'animation'] if k in option}
+
+
+def test_auto_tune_updates_filled_options():
+    chart = Chart()
+    chart.add_chart(Scatter('s', data=[[i, i] for i in range(3000)]))
+    assert tuned_options(chart) == {'large': True, 'animation': False}
+
+    chart.series[0].append_data([[i, i] for i in range(3000, 200000)])
+    chart.auto_tune()
+    assert tuned_options(chart) == {'large': True, 'progressive': 5000, 'progressiveChunkMode': 'mod',
+                                    'animation': False}
+
+    chart.series[0].data.set([[0, 0], [1, 1]])
+    chart.auto_tune()
+    assert tuned_options(chart) == {}
+
+
+def test_auto_tune_keeps_user_options():
+    chart = Chart()
+    chart.add_chart(Scatter('s', data=[[i, i] for i in range(3000)], animation=True))
+    chart.series[0].opts(large=False)
+    chart.auto_tune()
+    assert tuned_options(chart) == {'large': False, 'animation': True}
+    chart.series[0].data.set([[0, 0]])
+    chart.auto_tune()
+    assert tuned_options(chart) == {'large': False, 'animation': True}